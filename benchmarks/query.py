@@ -0,0 +1,53 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+"""
+Microbenchmarks of Query parsing and encoding.
+
+Usage:
+  python benchmarks/query.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+SETUP = """
+import furl
+querystr = '&'.join('param%d=value%%20%d' % (i, i) for i in range(32))
+tokens = '&'.join('token%d=%s' % (i, 'AbC%2B123-x_%26' * 4) for i in range(32))
+q = furl.Query(querystr)
+batch = [('param%d' % (i % 256), [] if i % 5 else str(i)) for i in range(512)]
+batchq = furl.Query([('param%d' % i, 'value') for i in range(512)])
+page = [0]
+def paginate():
+  page[0] += 1
+  q.params['page'] = str(page[0])
+  return q.encode()
+"""
+
+BENCHMARKS = [
+  ('Query(querystr)', 'furl.Query(querystr)'),
+  ('Query(querystr).params', 'furl.Query(querystr).params'),
+  ('q.encode()', 'q.encode()'),
+  ('Query(tokens).encode()', 'furl.Query(tokens).encode()'),
+  ("add one param to tokens", "furl.Query(tokens).add({'a': 'b'}).encode()"),
+  ("q.params['page'] = n", 'paginate()'),
+  ('Query(512 params).set()', 'furl.Query(batchq.params).set(batch)'),
+  ]
+
+def main(number=1000, repeat=5):
+  for name, statement in BENCHMARKS:
+    best = min(timeit.repeat(statement, SETUP, number=number, repeat=repeat))
+    print '%-24s %8.3f usec per call' % (name, best * 1e6 / number)
+
+if __name__ == '__main__':
+  main()
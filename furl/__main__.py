@@ -0,0 +1,14 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
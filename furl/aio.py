@@ -0,0 +1,109 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+"""
+asyncio coroutines that parse and transform many URLs in bounded chunks,
+yielding to the event loop between chunks so that other tasks, like other
+connections of a server, aren't stalled by one large batch of URLs.
+
+Requires trollius, the asyncio backport for Python 2, so coroutines wait on
+other coroutines with 'yield From(...)' instead of 'await'.
+"""
+
+from functools import partial
+from itertools import islice
+
+import trollius as asyncio
+from trollius import From, Return
+
+from .furl import furl
+from .bulk import _apply
+
+# Default number of URLs handled between yields to the event loop.
+CHUNKSIZE = 100
+
+@asyncio.coroutine
+def aparse(urls, chunksize=CHUNKSIZE, strict=False, executor=None, loop=None):
+  """
+  Parse each URL in <urls> into a furl, <chunksize> URLs at a time, yielding to
+  the event loop between chunks.
+
+  Example:
+    @trollius.coroutine
+    def handle(request):
+      furls = yield From(furl.aio.aparse(request.redirect_urls))
+
+  Params:
+    urls: Iterable of URLs.
+    chunksize: Number of URLs parsed between yields to the event loop.
+    strict: Passed to furl() when parsing each URL.
+    executor: Optional concurrent.futures.Executor, like a ThreadPoolExecutor,
+      to parse each chunk in instead of in the event loop's thread.
+    loop: Event loop running this coroutine. Defaults to the current event
+      loop.
+  Returns: List of furl objects, in the same order as <urls>.
+
+  Raises: ValueError on invalid URL or invalid chunksize.
+  """
+  results = yield From(_chunked(_parse_chunk, urls, chunksize, strict,
+                                executor, loop))
+  raise Return(results)
+
+@asyncio.coroutine
+def amap(func, urls, chunksize=CHUNKSIZE, strict=False, executor=None,
+         loop=None):
+  """
+  Parse each URL in <urls> into a furl, transform it with <func>, and serialize
+  the result back into a URL string, <chunksize> URLs at a time, yielding to
+  the event loop between chunks. The asynchronous counterpart of
+  furl.bulk.map().
+
+  Params:
+    func: Function called with each parsed furl, exactly like
+      furl.bulk.map()'s <func>. With a ProcessPoolExecutor <executor>, <func>
+      must be picklable.
+    urls, chunksize, strict, executor, loop: See aparse().
+  Returns: List of the transformed URL strings, in the same order as <urls>.
+
+  Raises: ValueError on invalid URL or invalid chunksize.
+  """
+  results = yield From(_chunked(partial(_transform_chunk, func), urls,
+                                chunksize, strict, executor, loop))
+  raise Return(results)
+
+@asyncio.coroutine
+def _chunked(handle, urls, chunksize, strict, executor, loop):
+  """
+  Returns: List of the concatenated results of handle(chunk, strict) for each
+  chunk of <chunksize> URLs in <urls>, run in <executor> if provided.
+  """
+  if chunksize < 1:
+    raise ValueError("Invalid chunksize: '%s'" % chunksize)
+  if loop is None:
+    loop = asyncio.get_event_loop()
+
+  results = []
+  urls = iter(urls)
+  while True:
+    chunk = list(islice(urls, chunksize))
+    if not chunk:
+      break
+    if executor is None:
+      results.extend(handle(chunk, strict))
+      yield From(asyncio.sleep(0, loop=loop)) # Let other tasks run.
+    else:
+      results.extend((yield From(
+        loop.run_in_executor(executor, handle, chunk, strict))))
+  raise Return(results)
+
+def _parse_chunk(urls, strict):
+  return [furl(url, strict=strict) for url in urls]
+
+def _transform_chunk(func, urls, strict):
+  return [_apply(func, url, strict) for url in urls]
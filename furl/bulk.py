@@ -0,0 +1,120 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import multiprocessing
+from itertools import islice
+from collections import deque
+
+from .furl import furl
+
+def map(func, urls, workers=None, chunksize=1000, strict=False):
+  """
+  Parse each URL in <urls> into a furl, transform it with <func>, and serialize
+  the result back into a URL string, spreading the work across a pool of
+  <workers> processes.
+
+  URLs are sent to and from the worker processes in chunks of <chunksize> URLs,
+  packed into one newline separated string per chunk, instead of as pickled
+  furl objects. At most two chunks per worker are in flight at once, so <urls>
+  can be an arbitrarily long iterator.
+
+  Example:
+    def https(f):
+      return f.set(scheme='https').remove(args=['utm_source'])
+
+    for url in furl.bulk.map(https, open('urls.txt').read().splitlines()):
+      print url
+
+  Params:
+    func: Function called with each parsed furl. It can return the furl, modify
+      the furl in place and return None, or return any other object whose str()
+      is the transformed URL. With more than one worker, <func> must be
+      picklable, like a function defined at the top level of a module.
+    urls: Iterable of URLs.
+    workers: Number of worker processes. Defaults to the number of CPUs. With
+      one worker or less, all URLs are transformed in this process.
+    chunksize: Number of URLs sent to a worker at a time.
+    strict: Passed to furl() when parsing each URL.
+  Returns: Iterator of the transformed URL strings, in the same order as
+  <urls>.
+
+  Raises: ValueError on invalid URL or on a URL or transformed URL containing a
+  newline.
+  """
+  if workers is None:
+    workers = multiprocessing.cpu_count()
+  if chunksize < 1:
+    raise ValueError("Invalid chunksize: '%s'" % chunksize)
+
+  blocks = _pack(urls, chunksize)
+  if workers <= 1:
+    for block in blocks:
+      for url in _transform(func, block, strict).split('\n'):
+        yield url
+    return
+
+  pool = multiprocessing.Pool(workers)
+  try:
+    pending = deque()
+    for block in blocks:
+      pending.append(pool.apply_async(_transform, (func, block, strict)))
+      if len(pending) >= 2 * workers:
+        for url in pending.popleft().get().split('\n'):
+          yield url
+    while pending:
+      for url in pending.popleft().get().split('\n'):
+        yield url
+    pool.close()
+  finally:
+    pool.terminate()
+
+def _pack(urls, chunksize):
+  """
+  Returns: Iterator of newline separated strings of <chunksize> URLs each, from
+  <urls>.
+
+  Raises: ValueError on a URL containing a newline.
+  """
+  urls = iter(urls)
+  while True:
+    chunk = [str(url) for url in islice(urls, chunksize)]
+    if not chunk:
+      return
+    block = '\n'.join(chunk)
+    if block.count('\n') != len(chunk) - 1:
+      raise ValueError('URLs must not contain newlines.')
+    yield block
+
+def _transform(func, block, strict):
+  """
+  Runs in the worker processes. Parse each URL in the newline separated string
+  <block>, transform it with <func>, and serialize it again.
+
+  Returns: Newline separated string of the transformed URLs.
+
+  Raises: ValueError on invalid URL or a transformed URL containing a newline.
+  """
+  results = []
+  for url in block.split('\n'):
+    result = _apply(func, url, strict)
+    if '\n' in result:
+      raise ValueError("Transformed URL contains a newline: '%s'" % result)
+    results.append(result)
+  return '\n'.join(results)
+
+def _apply(func, url, strict):
+  """
+  Returns: The string of <func> applied to the furl of <url>: the furl itself
+  if <func> returns None, str() of what <func> returns otherwise.
+
+  Raises: ValueError on invalid URL.
+  """
+  f = furl(url, strict=strict)
+  result = func(f)
+  return str(f if result is None else result)
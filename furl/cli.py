@@ -0,0 +1,200 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+"""
+Stream newline separated URLs from files or stdin through furl.add(),
+furl.set(), and furl.remove() operations and write the resulting URLs, or some
+of their components as tab separated values, to stdout or a file.
+
+Examples:
+  python -m furl --set scheme=https --remove args=utm_source urls.txt
+  python -m furl --add args='a=b&c=d' --set port=8080 -o out.gz urls.gz
+  zcat access.gz | python -m furl -z --extract host,path --stats
+"""
+
+import sys
+import time
+import zlib
+import gzip
+import inspect
+import optparse
+
+from .furl import furl
+
+USAGE = '%prog [options] [FILE ...]'
+
+# URL components that can be extracted with --extract.
+FIELDS = ['scheme', 'username', 'password', 'host', 'port', 'netloc', 'path',
+          'query', 'fragment', 'url']
+
+# Buffer size, in bytes, of reads and writes.
+BUFSIZE = 1 << 16
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+  """
+  Run the command line interface with the arguments <argv>, which default to
+  sys.argv[1:].
+
+  Returns: Exit status: 0 on success, 1 on an invalid URL, and 2 on invalid
+  arguments.
+  """
+  stdin, stdout, stderr = (stdin or sys.stdin, stdout or sys.stdout,
+                           stderr or sys.stderr)
+  parser = _parser()
+  options, paths = parser.parse_args(argv)
+
+  fields = None
+  if options.extract:
+    fields = options.extract.split(',')
+    for field in fields:
+      if field not in FIELDS:
+        parser.error("Invalid --extract field: '%s'. Valid fields are %s." %
+                     (field, ', '.join(FIELDS)))
+
+  output = outfile = stdout
+  if options.output and options.output != '-':
+    output = outfile = open(options.output, 'wb', BUFSIZE)
+  if options.gzip_output or (options.output or '').endswith('.gz'):
+    output = gzip.GzipFile(fileobj=output, mode='wb')
+
+  start, count, invalid = time.time(), 0, 0
+  try:
+    for path, lineno, line in _lines(paths or ['-'], stdin,
+                                     options.gzip_input):
+      count += 1
+      try:
+        f = furl(line, strict=options.strict)
+        for method, kwargs in options.operations:
+          getattr(f, method)(**kwargs)
+      except ValueError as e:
+        if options.skip_invalid:
+          invalid += 1
+          continue
+        stderr.write('%s:%i: %s\n' % (path, lineno, e))
+        return 1
+
+      if fields is None:
+        output.write(str(f))
+      else:
+        output.write('\t'.join(_extract(f, field) for field in fields))
+      output.write('\n')
+  finally:
+    if output is not outfile: # GzipFile doesn't close the file it wraps.
+      output.close()
+    if outfile is not stdout:
+      outfile.close()
+    else:
+      outfile.flush()
+
+  if options.stats:
+    elapsed = time.time() - start
+    stderr.write('%i lines, %i invalid, in %.2f seconds (%i lines/s)\n' %
+                 (count, invalid, elapsed, count / elapsed if elapsed else 0))
+  return 0
+
+def _parser():
+  parser = optparse.OptionParser(
+    usage=USAGE, prog='python -m furl', description=(
+      'Transform newline separated URLs read from FILEs, or stdin if no FILE '
+      "or FILE is '-'. Operations are applied to each URL in the order given "
+      'and mirror the keyword arguments of furl.add(), furl.set(), and '
+      "furl.remove(). For example, '--set port=8080' calls "
+      "furl.set(port='8080'). FILEs ending in '.gz' are read with gzip."))
+  parser.set_defaults(operations=[])
+  for method in ['add', 'set', 'remove']:
+    names = inspect.getargspec(getattr(furl, method)).args[1:]
+    parser.add_option(
+      '--' + method, action='callback', type='string', metavar='NAME=VALUE',
+      callback=_operation_callback, callback_args=(method, names),
+      help='Call furl.%s(NAME=VALUE) on each URL. NAME is one of %s.%s' %
+      (method, ', '.join(names), " '--remove NAME' without a VALUE calls "
+       'furl.remove(NAME=True).' if method == 'remove' else ''))
+  parser.add_option(
+    '-e', '--extract', metavar='FIELDS', help=(
+      'Write the comma separated FIELDS of each URL as tab separated values '
+      'instead of the URL. FIELDS are any of %s.' % ', '.join(FIELDS)))
+  parser.add_option('-o', '--output', metavar='FILE', help=(
+    "Write to FILE instead of stdout. Gzipped if FILE ends in '.gz'."))
+  parser.add_option('-z', '--gzip-input', action='store_true', default=False,
+                    help='Read all input, including stdin, with gzip.')
+  parser.add_option('-Z', '--gzip-output', action='store_true', default=False,
+                    help='Write output with gzip.')
+  parser.add_option('--skip-invalid', action='store_true', default=False,
+                    help='Skip invalid URLs instead of exiting.')
+  parser.add_option('--strict', action='store_true', default=False,
+                    help='Parse URLs with furl(strict=True).')
+  parser.add_option('--stats', action='store_true', default=False,
+                    help='Report the number of lines per second to stderr.')
+  return parser
+
+def _operation_callback(option, opt, value, parser, method, names):
+  name, sep, value = value.partition('=')
+  if name not in names:
+    raise optparse.OptionValueError(
+      "Invalid %s NAME: '%s'. Valid NAMEs are %s." %
+      (opt, name, ', '.join(names)))
+  if not sep:
+    if method != 'remove':
+      raise optparse.OptionValueError(
+        "%s requires NAME=VALUE, not '%s'." % (opt, name))
+    value = True
+  elif name == 'fragment_separator':
+    value = value.lower() not in ['', '0', 'false', 'no']
+  parser.values.operations.append((method, {name: value}))
+
+def _extract(f, field):
+  value = getattr(f, field)
+  return '' if value is None else str(value)
+
+def _lines(paths, stdin, gzipped):
+  """
+  Returns: Iterator of (path, line number, line) tuples of the lines in the
+  files <paths>, read in constant memory. Line endings are stripped.
+  """
+  for path in paths:
+    fileobj = stdin if path == '-' else open(path, 'rb', BUFSIZE)
+    try:
+      lines = fileobj
+      if gzipped or path.endswith('.gz'):
+        lines = _gunzip_lines(fileobj)
+      for lineno, line in enumerate(lines, 1):
+        yield path, lineno, line.rstrip('\r\n')
+    finally:
+      if fileobj is not stdin:
+        fileobj.close()
+
+def _gunzip_lines(fileobj):
+  """
+  Decompress the gzip stream <fileobj> incrementally. Unlike gzip.GzipFile,
+  <fileobj> doesn't need to be seekable, so pipes like stdin work too.
+  Concatenated gzip members are all decompressed.
+
+  Returns: Iterator of the decompressed lines, with line endings.
+  """
+  decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+  pending = ''
+  while True:
+    data = fileobj.read(BUFSIZE)
+    if not data:
+      break
+    while data:
+      pending += decompressor.decompress(data)
+      data = decompressor.unused_data
+      if data: # Start of the next gzip member.
+        pending += decompressor.flush()
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    lines = pending.split('\n')
+    pending = lines.pop()
+    for line in lines:
+      yield line + '\n'
+
+  pending += decompressor.flush()
+  if pending:
+    yield pending
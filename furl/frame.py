@@ -0,0 +1,235 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import urlparse
+from array import array
+
+import numpy as np
+
+from .furl import furl, _split_url, _parse_netloc
+
+class UrlFrame(object):
+  """
+  Columnar container of many parsed URLs, backed by NumPy arrays instead of one
+  furl object per URL.
+
+  Schemes and hosts are dictionary encoded: each distinct scheme or host string
+  is stored once, in self.schemes or self.hosts, and each URL stores its index
+  into that list. Ports are stored like furl.port, with the scheme's default
+  port filled in, but as a uint16 array where 0 means no port. The userinfo,
+  path, query, and fragment strings of all URLs are concatenated, still encoded,
+  into one shared buffer and each URL stores the offset and length of each of
+  its components in that buffer.
+
+  URLs are split and their network locations parsed exactly like furl.load()
+  does, so schemes and hosts are lowercased and invalid URLs raise ValueError.
+  Paths, queries, and fragments are never decoded. Rebuilt URLs from to_urls()
+  are identical to furl(url, lazy=True).url.
+
+  Indexing a UrlFrame with an integer returns a new furl object for that URL,
+  and indexing it with a slice, an integer array, or a boolean mask returns a
+  new UrlFrame of the selected URLs that shares its buffer and dictionaries
+  with this UrlFrame.
+
+  Attributes:
+    schemes: List of distinct scheme strings.
+    scheme_codes: int32 array of each URL's index into self.schemes.
+    hosts: List of distinct host strings.
+    host_codes: int32 array of each URL's index into self.hosts.
+    ports: uint16 array of each URL's port, 0 if the URL has no port.
+    buffer: String holding the userinfo, path, query, and fragment strings of
+      all URLs.
+    userinfo_offsets, userinfo_lengths: Offset and length of each URL's
+      'username:password' string in self.buffer.
+    path_offsets, path_lengths: Offset and length of each URL's path string in
+      self.buffer.
+    query_offsets, query_lengths: Offset and length of each URL's query string
+      in self.buffer.
+    fragment_offsets, fragment_lengths: Offset and length of each URL's
+      fragment string in self.buffer.
+  """
+  COMPONENTS = ['userinfo', 'path', 'query', 'fragment']
+
+  def __init__(self, urls=()):
+    """
+    Params:
+      urls: Iterable of URLs to parse.
+    Raises: ValueError on invalid URL.
+    """
+    schemes, hosts, scheme_index, host_index = [], [], {}, {}
+    scheme_codes, host_codes, ports = array('i'), array('i'), array('H')
+    spans = dict((component, (array('l'), array('l')))
+                 for component in self.COMPONENTS)
+    userinfo_spans, path_spans, query_spans, fragment_spans = [
+      spans[component] for component in self.COMPONENTS]
+    default_ports = furl.DEFAULT_PORTS
+    buf, position = bytearray(), 0
+
+    for url in urls:
+      # Raises ValueError on malformed IPv6 address or invalid port.
+      scheme, netloc, path, query, fragment = _split_url(str(url))
+      username, password, host, port = _parse_netloc(netloc)
+
+      code = scheme_index.get(scheme)
+      if code is None:
+        code = scheme_index[scheme] = len(schemes)
+        schemes.append(scheme)
+      scheme_codes.append(code)
+
+      code = host_index.get(host)
+      if code is None:
+        code = host_index[host] = len(hosts)
+        hosts.append(host)
+      host_codes.append(code)
+
+      if not port:
+        port = default_ports.get(scheme)
+      ports.append(port or 0)
+
+      userinfo = username + ':' + password if password else username
+      for value, (offsets, lengths) in ((userinfo, userinfo_spans),
+                                        (path, path_spans),
+                                        (query, query_spans),
+                                        (fragment, fragment_spans)):
+        offsets.append(position)
+        lengths.append(len(value))
+        buf.extend(value)
+        position += len(value)
+
+    self.schemes, self.hosts = schemes, hosts
+    self.scheme_codes = _to_numpy(scheme_codes, np.int32)
+    self.host_codes = _to_numpy(host_codes, np.int32)
+    self.ports = _to_numpy(ports, np.uint16)
+    self.buffer = str(buf)
+    for component in self.COMPONENTS:
+      offsets, lengths = spans[component]
+      setattr(self, component + '_offsets', _to_numpy(offsets, np.int64))
+      setattr(self, component + '_lengths', _to_numpy(lengths, np.int64))
+
+  def host_mask(self, hosts):
+    """
+    Params:
+      hosts: Host string or iterable of host strings. Hosts are compared
+        lowercased, like furl.host.
+    Returns: Boolean array that's True for each URL whose host is in <hosts>.
+    """
+    if isinstance(hosts, basestring):
+      hosts = [hosts]
+    index = dict((host, code) for code, host in enumerate(self.hosts))
+    codes = [index[host.lower()] for host in hosts if host.lower() in index]
+    return np.in1d(self.host_codes, np.array(codes, dtype=np.int32))
+
+  def filter_hosts(self, hosts):
+    """
+    Returns: New UrlFrame of the URLs whose host is in <hosts>. See
+    host_mask().
+    """
+    return self[self.host_mask(hosts)]
+
+  def default_ports(self):
+    """
+    Returns: uint16 array of each URL's default port from furl.DEFAULT_PORTS for
+    its scheme, 0 if its scheme has no default port.
+    """
+    defaults = np.array([furl.DEFAULT_PORTS.get(scheme, 0)
+                         for scheme in self.schemes], dtype=np.uint16)
+    return defaults[self.scheme_codes]
+
+  def default_port_mask(self):
+    """
+    Returns: Boolean array that's True for each URL whose port is its scheme's
+    default port. Default ports are omitted from rebuilt URLs, like they are
+    from furl.netloc.
+    """
+    return (self.ports != 0) & (self.ports == self.default_ports())
+
+  def scheme_column(self):
+    """
+    Returns: List of each URL's scheme string.
+    """
+    schemes = self.schemes
+    return [schemes[code] for code in self.scheme_codes.tolist()]
+
+  def host_column(self):
+    """
+    Returns: List of each URL's host string.
+    """
+    hosts = self.hosts
+    return [hosts[code] for code in self.host_codes.tolist()]
+
+  def column(self, component):
+    """
+    Params:
+      component: 'userinfo', 'path', 'query', or 'fragment'.
+    Returns: List of each URL's raw, still encoded, <component> string, sliced
+    from self.buffer.
+    """
+    buf = self.buffer
+    offsets = getattr(self, component + '_offsets').tolist()
+    lengths = getattr(self, component + '_lengths').tolist()
+    return [buf[offset:offset + length]
+            for offset, length in zip(offsets, lengths)]
+
+  def to_urls(self):
+    """
+    Returns: List of URL strings rebuilt from this UrlFrame's columns.
+    """
+    ports = np.where(self.default_port_mask(), 0, self.ports).tolist()
+    columns = zip(self.scheme_column(), self.column('userinfo'),
+                  self.host_column(), ports, self.column('path'),
+                  self.column('query'), self.column('fragment'))
+
+    urls = []
+    for scheme, userinfo, host, port, path, query, fragment in columns:
+      netloc = userinfo + '@' + host if userinfo else host
+      if port:
+        netloc += ':' + str(port)
+      urls.append(urlparse.urlunsplit((scheme, netloc, path, query, fragment)))
+    return urls
+
+  def __len__(self):
+    return len(self.ports)
+
+  def __getitem__(self, index):
+    """
+    Returns: A new furl object if <index> is an integer, otherwise a new
+    UrlFrame of the URLs selected by the slice, integer array, or boolean mask
+    <index>.
+    """
+    if isinstance(index, (int, long, np.integer)):
+      frame = self[np.array([index])]
+      return furl(frame.to_urls()[0])
+
+    frame = self.__class__()
+    frame.schemes, frame.hosts, frame.buffer = (
+      self.schemes, self.hosts, self.buffer)
+    for attr in ['scheme_codes', 'host_codes', 'ports'] + [
+        component + suffix for component in self.COMPONENTS
+        for suffix in ['_offsets', '_lengths']]:
+      setattr(frame, attr, getattr(self, attr)[index])
+    return frame
+
+  def __iter__(self):
+    """
+    Returns: Iterator of rebuilt URL strings. See to_urls().
+    """
+    return iter(self.to_urls())
+
+  def __repr__(self):
+    return "%s(<%i urls>)" % (self.__class__.__name__, len(self))
+
+
+def _to_numpy(arr, dtype):
+  """
+  Returns: A new NumPy array of type <dtype> with the values of the array.array
+  <arr>, converted without iterating over <arr> in Python.
+  """
+  if not arr:
+    return np.zeros(0, dtype=dtype)
+  return np.frombuffer(arr, dtype=arr.typecode).astype(dtype)
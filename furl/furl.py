@@ -12,11 +12,43 @@ import abc
 import urllib
 import urlparse
 import warnings
+import threading
+from itertools import izip
+from collections import namedtuple
+try:
+  from collections import OrderedDict as odict # Python 2.7+.
+except ImportError:
+  from ordereddict import OrderedDict as odict # Python 2.4-2.6.
 
 from omdict1D import omdict1D
 
 _absent = object()
 
+# The _raw dictionary shared by all furls that aren't lazy. See furl._raw.
+_NOT_LAZY = {}
+
+def _getstate(self):
+  """
+  Classes with __slots__ have no instance __dict__ for pickle and copy to
+  save and restore, so their __getstate__ is this function.
+
+  Returns: Pickle state of <self> as a (__dict__ or None, slots) tuple, where
+  slots is a dictionary of the values of all set slots of <self>'s class and
+  base classes. pickle and copy restore slots with setattr(). Unset slots, like
+  the Path, Query, and Fragment of a lazy furl that haven't been built yet, are
+  left out instead of being built.
+  """
+  slots = {}
+  for cls in type(self).__mro__:
+    for attr in cls.__dict__.get('__slots__', ()):
+      if attr == '__weakref__': # Not state, and can't be set.
+        continue
+      try:
+        slots[attr] = cls.__dict__[attr].__get__(self, cls)
+      except AttributeError: # Unset slot.
+        pass
+  return getattr(self, '__dict__', None), slots
+
 #
 # TODO(grun): Subclass Path, PathCompositionInterface, Query, and
 # QueryCompositionInterface into two subclasses each - one for the URL and one
@@ -62,11 +94,20 @@ class Path(object):
     strict: Boolean whether or not UserWarnings should be raised if improperly
       encoded path strings are provided to methods that take such strings, like
       load(), add(), set(), remove(), etc.
+    _cache: None or (segments, isabsolute, string) tuple of the last path string
+      built by __str__() and the copy of self.segments and the value of
+      self.isabsolute it was built from. self.segments can be modified in
+      place, so the cached string is only reused if both still match.
   """
+  __slots__ = ['segments', 'strict', '_isabsolute', '_absolute_if_not_empty',
+               '_cache', '__weakref__']
+  __getstate__ = _getstate
+
   SAFE_SEGMENT_CHARS = ":@-._~!$&'()*+,;="
   
   def __init__(self, path='', absolute_if_not_empty=False, strict=False):
     self.segments = []
+    self._cache = None
 
     self.strict = strict
     self._isabsolute = False
@@ -95,10 +136,32 @@ class Path(object):
 
     if self.isabsolute and len(segments) > 1 and segments[0] == '':
       segments.pop(0)
-    self.segments = [urllib.unquote(segment) for segment in segments]
+
+    pool = _intern_pool
+    if pool is None:
+      self.segments = [urllib.unquote(segment) for segment in segments]
+    else:
+      intern = pool.intern
+      self.segments = [intern(urllib.unquote(segment)) for segment in segments]
 
     return self
 
+  def _snapshot(self):
+    """
+    Returns: Immutable snapshot of this path that _restore() can adopt.
+    """
+    return tuple(self.segments), self._isabsolute
+
+  def _restore(self, snapshot):
+    """
+    Adopt <snapshot>, a snapshot from _snapshot(), replacing any existing path.
+
+    Returns: <self>.
+    """
+    segments, self._isabsolute = snapshot
+    self.segments = list(segments)
+    return self
+
   def add(self, path):
     """
     Add <path> to the existing path. <path> can either be a list of segments or
@@ -169,10 +232,15 @@ class Path(object):
     return len(self.segments) > 0
 
   def __str__(self):
-    segments = list(self.segments)
-    if self.isabsolute and self.segments:
-      segments.insert(0, '')
-    return self._path_from_segments(segments, quoted=True)
+    isabsolute, cache = self.isabsolute, self._cache
+    if cache is None or cache[1] != isabsolute or cache[0] != self.segments:
+      segments = list(self.segments)
+      if isabsolute and segments:
+        segments.insert(0, '')
+      cache = self._cache = (
+        list(self.segments), isabsolute,
+        self._path_from_segments(segments, quoted=True))
+    return cache[2]
     
   def __repr__(self):
     return "%s('%s')" % (self.__class__.__name__, str(self))
@@ -219,6 +287,8 @@ class PathCompositionInterface(object):
   Abstract class interface for a parent class that contains a Path.
   """
   __metaclass__ = abc.ABCMeta
+  __slots__ = () # The parent class provides the _path slot.
+
   def __init__(self, absolute_if_not_empty=False, strict=False):
     """
     Params:
@@ -230,20 +300,15 @@ class PathCompositionInterface(object):
   @property
   def path(self):
     return self._path
+
+  @path.setter
+  def path(self, path):
+    self._path.load(path)
   
   @property
   def pathstr(self):
     return str(self._path)
 
-  def __setattr__(self, attr, value):
-    """
-    Returns: True if this attribute is handled and set here, False otherwise.
-    """
-    if attr == 'path':
-      self._path.load(value)
-      return True
-    return False
-
 
 class Query(object):
   """
@@ -300,23 +365,180 @@ class Query(object):
     strict: Boolean whether or not UserWarnings should be raised if improperly
       encoded query strings are provided to methods that take such strings, like
       load(), add(), set(), remove(), etc.
+    _cache: None or (items, delimeter, string, pairs) tuple of the last query
+      string built by encode() and the items of self.params and the delimeter
+      it was built from. self.params can be modified in place, so the cached
+      string is only reused if both still match. <items> is None if the string
+      can't be reused. <pairs> maps each (key, value) string item of the last
+      encode() to its encoded 'key=value' pair, so only pairs added or changed
+      since are encoded again.
+    _raw: None or tuple of the still encoded 'key=value' pair strings of the
+      last loaded query string, if self.params hasn't been accessed since. They
+      are only decoded into self.params when self.params is first accessed.
+      Until then, encode() emits the pairs already encoded the way encode()
+      would encode them as is, without decoding and encoding them again. While
+      self._raw is set, self._cache holds the last string encode() built from
+      it.
+    _shared: Boolean whether or not self.params has been handed out. Once it
+      has, references to it can be held, like a = f.args, so query strings
+      loaded afterwards are decoded into it right away instead of being kept in
+      self._raw.
   """
+  __slots__ = ['strict', '_params', '_cache', '_raw', '_shared',
+               '__weakref__']
+  __getstate__ = _getstate
+
   SAFE_KEY_CHARS   = "/?:@-._~!$'()*,"
   SAFE_VALUE_CHARS = "/?:@-._~!$'()*,="
+
+  # Keys and values longer than this are encoded and written in chunks of this
+  # many characters by write_to().
+  WRITE_CHUNK_SIZE = 1 << 16
+
+  # Characters read from a stream at a time by load_stream() and iter_stream().
+  STREAM_CHUNK_SIZE = 1 << 16
   
   def __init__(self, query='', strict=False):
     self.strict = strict
 
     self._params = omdict1D()
+    self._cache = None
+    self._raw = None
+    self._shared = False
 
     self.load(query)
 
-  def load(self, query):
-    self.params.load(self._items(query))
+  def load(self, query, delimeter=None):
+    """
+    Load <query>, replacing any existing parameters.
+
+    Params:
+      query: Encoded query string or container of key:value items. See
+        _items().
+      delimeter: Delimeter separating the key:value pairs of an encoded query
+        string <query>, like the delimeter given to encode(). Defaults to None,
+        which splits pairs on both '&' and ';'.
+    Returns: <self>.
+    """
+    if isinstance(query, basestring):
+      # Keys and values are decoded when self.params is first accessed.
+      pairstrs = self._split(query, delimeter)
+      if pairstrs:
+        return self._load_raw(pairstrs)
+    self._raw = None
+    self._params.load(self._items(query, delimeter))
+    return self
+
+  def load_stream(self, stream, chunk_size=None, delimeter=None):
+    """
+    Load the encoded query string read from <stream>, like an
+    application/x-www-form-urlencoded request body, replacing any existing
+    parameters. The query string is parsed incrementally as it's read, so it's
+    never held in memory all at once. The loaded parameters are the same as
+    those of load() with the whole query string.
+
+    Params:
+      stream: File-like object with a read() method.
+      chunk_size: See iter_stream().
+      delimeter: See load().
+    Returns: <self>.
+
+    Raises: UserWarning if the query string read from <stream> is improperly
+    encoded and self.strict is True.
+    """
+    self._raw = None
+    self._params.clear()
+    for items in self._read_stream(stream, chunk_size, delimeter):
+      self._params.additems(items)
+    return self
+
+  def iter_stream(self, stream, chunk_size=None, delimeter=None):
+    """
+    Parse the encoded query string read from <stream> incrementally, without
+    loading it into self.params.
+
+    Example:
+      list(Query().iter_stream(StringIO('a=1&b=2+2'), chunk_size=3)) ==
+        [('a', '1'), ('b', '2 2')]
+
+    Params:
+      stream: File-like object with a read() method.
+      chunk_size: Number of characters read from <stream> at a time. Defaults to
+        STREAM_CHUNK_SIZE. Pairs split across chunks are joined before they're
+        unquoted.
+      delimeter: See load().
+    Returns: Iterator of the unquoted (key, value) tuples of the query string,
+    in order, each yielded once the chunk it ends in has been read.
+
+    Raises: UserWarning if the query string read from <stream> is improperly
+    encoded and self.strict is True.
+    """
+    for items in self._read_stream(stream, chunk_size, delimeter):
+      for item in items:
+        yield item
+
+  def _read_stream(self, stream, chunk_size=None, delimeter=None):
+    """
+    Returns: Iterator of lists of the unquoted (key, value) tuples of the pairs
+    completed by each chunk read from <stream>. See iter_stream().
+    """
+    read, size = stream.read, chunk_size or self.STREAM_CHUNK_SIZE
+    delimeters = ('&', ';') if delimeter is None else (delimeter,)
+    warn = self.strict
+
+    pending = [] # Chunks of the last, possibly incomplete, pair.
+    while True:
+      chunk = read(size)
+      if chunk:
+        pending.append(chunk)
+        if not any(d in chunk for d in delimeters):
+          continue # A delimeter split across chunks is found later.
+
+      joined = ''.join(pending)
+      pairstrs = _split_pairs(joined, delimeter)
+      pending = [pairstrs.pop()] if chunk else []
+      if warn and self._warn_if_invalid(joined, pairstrs):
+        warn = False
+      yield self._decode(pairstr for pairstr in pairstrs if pairstr)
+
+      if not chunk:
+        break
+
+  def _snapshot(self):
+    """
+    Returns: Immutable snapshot of this query that _restore() can adopt. Either
+    a tuple of the (key, value) items of self.params or, if self.params hasn't
+    been built yet, a tuple of the encoded pair strings of self._raw.
+    """
+    if self._raw is not None:
+      return self._raw
+    return tuple(self._params.iterallitems())
+
+  def _restore(self, snapshot):
+    """
+    Adopt <snapshot>, a snapshot from _snapshot(), replacing any existing query.
+
+    Returns: <self>.
+    """
+    if snapshot and type(snapshot[0]) is not tuple: # Encoded pair strings.
+      self._load_raw(snapshot)
+    else:
+      self._raw = None
+      self._params.load(snapshot)
     return self
 
   def add(self, args):
-    for param, value in self._items(args):
+    items = list(self._items(args))
+    raw = self._raw
+    if raw is not None and all(type(key) is str and type(value) is str
+                               for key, value in items):
+      # Encoded string items decode back to themselves, so they can be added
+      # to self._raw without decoding the rest of the query.
+      pairs = tuple(self._encode_pair(key, value) for key, value in items)
+      self._raw, self._cache = raw + pairs, None
+      return self
+
+    for param, value in items:
       self.params.add(param, value)
     return self
 
@@ -350,15 +572,18 @@ class Query(object):
 
   @property
   def params(self):
+    if self._raw is not None:
+      self._build()
+    self._shared = True
     return self._params
 
   @params.setter
   def params(self, params):
     items = self._items(params)
 
+    self._raw = None
     self._params.clear()
-    for key, value in items:
-      self._params.add(key, value)
+    self._params.additems(items)
 
   def encode(self, delimeter='&'):
     """
@@ -370,15 +595,131 @@ class Query(object):
     separating key:value pairs. The most common and default delimeter is '&',
     but ';' can also be specified. ';' is W3C recommended.
     """
-    pairs = []
-    for key, value in self.params.iterallitems():
-      pair = '='.join((urllib.quote_plus(str(key), self.SAFE_KEY_CHARS),
-                       urllib.quote_plus(str(value), self.SAFE_VALUE_CHARS)))
+    if self._raw is not None:
+      return self._encode_raw(delimeter)
+
+    items, cache = self._params.allitems(), self._cache
+    if cache is not None and cache[1] == delimeter and cache[0] == items:
+      return cache[2]
+
+    memo = cache[3] if cache is not None else {}
+    pairs, newmemo, cacheable = [], {}, True
+    for item in items:
+      key, value = item
+      # Only memoize and cache string items. Other items can compare equal but
+      # encode differently, like 1 and 1.0.
+      if type(key) is str and type(value) is str:
+        pair = memo.get(item)
+        if pair is None:
+          pair = self._encode_pair(key, value)
+        newmemo[item] = pair
+      else:
+        pair = self._encode_pair(key, value)
+        cacheable = False
       pairs.append(pair)
-    return delimeter.join(pairs)
+    encoded = delimeter.join(pairs)
+
+    # Only the pairs of the current items are kept, so the memo never outgrows
+    # the query.
+    self._cache = (items if cacheable else None, delimeter, encoded, newmemo)
+    return encoded
+
+  def _encode_pair(self, key, value):
+    return _encode_pair(key, value, self.SAFE_KEY_CHARS, self.SAFE_VALUE_CHARS)
+
+  def _encode_raw(self, delimeter):
+    """
+    Returns: The query string of the encoded pairs in self._raw, joined with
+    <delimeter>. Pairs already encoded the way encode() would encode them are
+    used as is. Only the others are decoded and encoded again.
+    """
+    cache = self._cache
+    if cache is None or cache[1] != delimeter:
+      canonical = _canonical_pair_regex(
+        self.SAFE_KEY_CHARS, self.SAFE_VALUE_CHARS).match
+      pairs = [str(pairstr) if canonical(pairstr) else
+               self._encode_pair(*self._decode((pairstr,))[0])
+               for pairstr in self._raw]
+      cache = self._cache = (None, delimeter, delimeter.join(pairs), {})
+    return cache[2]
+
+  def _load_raw(self, pairstrs):
+    """
+    Adopt the tuple of encoded 'key=value' pair strings <pairstrs>, replacing
+    any existing parameters. They're kept in self._raw, to be decoded later,
+    unless self.params has been handed out, in which case they're decoded into
+    self.params right away so held references to it see them.
+
+    Returns: <self>.
+    """
+    if self._params:
+      self._params.clear()
+    self._raw, self._cache = pairstrs, None
+    if self._shared:
+      self._build()
+    return self
+
+  def _build(self):
+    """
+    Decode the encoded pairs of self._raw into self.params. The encoded pairs
+    that encode() would emit as is are kept as the encoded pairs of their items,
+    so they aren't encoded again by the next encode().
+    """
+    raw, self._raw = self._raw, None
+    items = self._decode(raw)
+    canonical = _canonical_pair_regex(
+      self.SAFE_KEY_CHARS, self.SAFE_VALUE_CHARS).match
+    memo = {}
+    for item, pairstr in izip(items, raw):
+      if (type(item[0]) is str and type(item[1]) is str and
+          canonical(pairstr)):
+        memo[item] = pairstr
+    self._params.load(items)
+    self._cache = (None, None, None, memo)
+
+  def write_to(self, stream, delimeter='&'):
+    """
+    Write the URL encoded query string, the same string as
+    encode(<delimeter>), to <stream> piece by piece instead of building it
+    first. Keys and values longer than WRITE_CHUNK_SIZE characters are encoded
+    and written in chunks, so huge values are never encoded all at once.
+
+    Params:
+      stream: File-like object with a write() method.
+      delimeter: See encode().
+    """
+    if self._raw is not None: # Bounded by the size of the loaded string.
+      stream.write(self._encode_raw(delimeter))
+      return
+
+    items, cache = self._params.allitems(), self._cache
+    if cache is not None and cache[1] == delimeter and cache[0] == items:
+      stream.write(cache[2])
+      return
+
+    write = stream.write
+    for i, (key, value) in enumerate(items):
+      if i:
+        write(delimeter)
+      self._write_quoted(write, str(key), self.SAFE_KEY_CHARS)
+      write('=')
+      self._write_quoted(write, str(value), self.SAFE_VALUE_CHARS)
+
+  def _write_quoted(self, write, s, safe):
+    """
+    Write urllib.quote_plus(<s>, <safe>) with <write>, in chunks if <s> is
+    longer than WRITE_CHUNK_SIZE. quote_plus() quotes each character on its
+    own, so quoted chunks join to the quoted whole.
+    """
+    size = self.WRITE_CHUNK_SIZE
+    if len(s) <= size:
+      write(urllib.quote_plus(s, safe))
+    else:
+      for start in xrange(0, len(s), size):
+        write(urllib.quote_plus(s[start:start + size], safe))
 
   def __nonzero__(self):
-    return len(self.params) > 0
+    return self._raw is not None or len(self._params) > 0
 
   def __str__(self):
     return self.encode()
@@ -386,7 +727,7 @@ class Query(object):
   def __repr__(self):
     return "%s('%s')" % (self.__class__.__name__, str(self))
 
-  def _items(self, items):
+  def _items(self, items, delimeter=None):
     """
     Extract and return the key:value items from various containers. Some
     containers that could hold key:value items are
@@ -399,8 +740,7 @@ class Query(object):
 
     Keys and values are passed through unmodified unless they were passed in
     within an encoded query string, like 'a=a%20a&b=b'. Keys and values passed
-    in within an encoded query string are unquoted by urlparse.parse_qsl(),
-    which uses urllib.unquote_plus() internally.
+    in within an encoded query string are unquoted by _parse().
 
     Returns: List of items as (key, value) tuples. Keys and values are passed
     through unmodified unless they were passed in as part of an encoded query
@@ -424,35 +764,81 @@ class Query(object):
       items = list(items.items())
     # Encoded query string. i.e. 'a=1&b=2&c=3'
     elif isinstance(items, basestring):
-      # Raise a warning if self.strict is True and the user provided an
-      # improperly encoded query string.
-      if self.strict:
-        pairstrs = [s2 for s1 in items.split('&') for s2 in s1.split(';')]
-        pairs = map(lambda item: item.split('=', 1), pairstrs)
-        pairs = map(lambda p: (p[0],'') if len(p)==1 else (p[0],p[1]), pairs)
-        for key, value in pairs:
-          if (not is_valid_encoded_query_key(key) or
-              not is_valid_encoded_query_value(value)):
-            warnstr = (("Improperly encoded query string received: '%s'. "
-                        "Proceeding, but did you mean '%s'?") %
-                       (items, urllib.urlencode(pairs)))
-            warnings.warn(warnstr, UserWarning)
-            break
-
-      # Keys and values will be unquoted from the query string.
-      items = urlparse.parse_qsl(items, keep_blank_values=True)
+      items = self._parse(items, delimeter)
     # Default to list of key:value items interface. i.e. [('a','1'), ('b','2')]
     else:
       item = list(items)
 
     return items
 
+  def _parse(self, query, delimeter=None):
+    """
+    Split the encoded query string <query> into its key:value pairs and unquote
+    them like urlparse.parse_qsl(<query>, keep_blank_values=True) does.
+
+    Params:
+      delimeter: See load().
+    Returns: List of unquoted (key, value) tuples.
+
+    Raises: UserWarning if <query> is an improperly encoded query string and
+    self.strict is True.
+    """
+    return self._decode(self._split(query, delimeter))
+
+  def _split(self, query, delimeter=None):
+    """
+    Params:
+      delimeter: See load().
+    Returns: Tuple of the non-empty, still encoded 'key=value' pair strings of
+    the encoded query string <query>.
+
+    Raises: UserWarning if <query> is an improperly encoded query string and
+    self.strict is True.
+    """
+    pairstrs = _split_pairs(query, delimeter)
+
+    # Raise a warning if self.strict is True and the user provided an
+    # improperly encoded query string.
+    if self.strict:
+      self._warn_if_invalid(query, pairstrs)
+
+    if '' in pairstrs:
+      return tuple(pairstr for pairstr in pairstrs if pairstr)
+    return tuple(pairstrs)
+
+  def _warn_if_invalid(self, query, pairstrs):
+    """
+    Raise a UserWarning if any of the encoded 'key=value' pair strings
+    <pairstrs> of the query string <query> is improperly encoded.
+
+    Returns: True if a warning was raised, False otherwise.
+    """
+    pairs = [pairstr.partition('=')[::2] for pairstr in pairstrs]
+    for key, value in pairs:
+      if (not is_valid_encoded_query_key(key) or
+          not is_valid_encoded_query_value(value)):
+        warnstr = (("Improperly encoded query string received: '%s'. "
+                    "Proceeding, but did you mean '%s'?") %
+                   (query, urllib.urlencode(pairs)))
+        warnings.warn(warnstr, UserWarning)
+        return True
+    return False
+
+  def _decode(self, pairstrs):
+    """
+    Returns: List of the unquoted (key, value) tuples of the encoded
+    'key=value' pair strings <pairstrs>. See _decode_pair().
+    """
+    return [_decode_pair(pairstr) for pairstr in pairstrs]
+
   
 class QueryCompositionInterface(object):
   """
   Abstract class interface for a parent class that contains a Query.
   """
   __metaclass__ = abc.ABCMeta
+  __slots__ = () # The parent class provides the _query slot.
+
   def __init__(self, strict=False):
     self._query = Query(strict=strict)
 
@@ -460,6 +846,10 @@ class QueryCompositionInterface(object):
   def query(self):
     return self._query
 
+  @query.setter
+  def query(self, query):
+    self._query.load(query)
+
   @property
   def querystr(self):
     return str(self._query)
@@ -471,14 +861,9 @@ class QueryCompositionInterface(object):
     """
     return self._query.params
 
-  def __setattr__(self, attr, value):
-    """
-    Returns: True if this attribute is handled and set here, False otherwise.
-    """
-    if attr == 'args' or attr == 'query':
-      self._query.load(value)
-      return True
-    return False
+  @args.setter
+  def args(self, args):
+    self._query.load(args)
 
 
 class Fragment(PathCompositionInterface, QueryCompositionInterface):
@@ -497,6 +882,9 @@ class Fragment(PathCompositionInterface, QueryCompositionInterface):
       string. This is useful to build fragments like '#!arg1=val1&arg2=val2',
       where no separating '?' is desired.
   """
+  __slots__ = ['_path', '_query', 'strict', 'separator', '__weakref__']
+  __getstate__ = _getstate
+
   def __init__(self, fragment='', strict=False):
     PathCompositionInterface.__init__(self, absolute_if_not_empty=False,
                                       strict=strict)
@@ -531,6 +919,25 @@ class Fragment(PathCompositionInterface, QueryCompositionInterface):
       else:
         self._path.load(fragment)
 
+  def _snapshot(self):
+    """
+    Returns: Immutable snapshot of this fragment's path and query that
+    _restore() can adopt. self.separator isn't included; like load(),
+    _restore() leaves it untouched.
+    """
+    return self._path._snapshot(), self._query._snapshot()
+
+  def _restore(self, snapshot):
+    """
+    Adopt <snapshot>, a snapshot from _snapshot(), replacing the existing path
+    and query.
+
+    Returns: <self>.
+    """
+    self._path._restore(snapshot[0])
+    self._query._restore(snapshot[1])
+    return self
+
   def add(self, path=_absent, args=_absent):
     if path is not _absent:
       self.path.add(path)
@@ -556,11 +963,6 @@ class Fragment(PathCompositionInterface, QueryCompositionInterface):
       self.query.remove(args)
     return self
 
-  def __setattr__(self, attr, value):
-    if (not PathCompositionInterface.__setattr__(self, attr, value) and
-        not QueryCompositionInterface.__setattr__(self, attr, value)):
-      object.__setattr__(self, attr, value)
-
   def __nonzero__(self):
     return bool(self.path) or bool(self.query)
 
@@ -586,6 +988,8 @@ class FragmentCompositionInterface(object):
   Abstract class interface for a parent class that contains a Fragment.
   """
   __metaclass__ = abc.ABCMeta
+  __slots__ = () # The parent class provides the _fragment slot.
+
   def __init__(self, strict=False):
     self._fragment = Fragment(strict=strict)
 
@@ -593,18 +997,13 @@ class FragmentCompositionInterface(object):
   def fragment(self):
     return self._fragment
 
+  @fragment.setter
+  def fragment(self, fragment):
+    self._fragment.load(fragment)
+
   @property
   def fragmentstr(self):
     return str(self._fragment)
-  
-  def __setattr__(self, attr, value):
-    """
-    Returns: True if this attribute is handled and set here, False otherwise.
-    """
-    if attr == 'fragment':
-      self.fragment.load(value)
-      return True
-    return False
 
 
 class furl(PathCompositionInterface, QueryCompositionInterface,
@@ -631,47 +1030,158 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
     path: Path object from PathCompositionInterface.
     query: Query object from QueryCompositionInterface.
     fragment: Fragment object from FragmentCompositionInterface.
+    lazy: Boolean whether or not the Path, Query, and Fragment objects are only
+      built the first time they're accessed. Until then, the raw path, query,
+      and fragment strings are kept as is and str() emits them unchanged. If
+      strict is also True, UserWarnings about improperly encoded components are
+      raised when those components are first accessed, not on load().
+    _raw: Dictionary of the components that haven't been built yet, keyed by
+      attribute name ('_path', '_query', or '_fragment'). Values are either
+      the component's raw string or, in copies made by copy(), a (string,
+      snapshot, separator) tuple of the copied component's string, its
+      _snapshot(), and, for fragments, its separator. Empty if lazy is False,
+      except in copies until their components are accessed or loaded.
+    _cache: None or (components, url) tuple of the last URL string built by
+      __str__() and the scheme, username, password, host, port, and path,
+      query, and fragment strings it was built from. Path and Query cache their
+      own strings, so if only one component changes only that component is
+      encoded again.
   """
+  __slots__ = ['_path', '_query', '_fragment', '_raw', 'strict', 'lazy',
+               'scheme', 'username', 'password', '_host', '_port', '_cache',
+               '__weakref__']
+  __getstate__ = _getstate
+
   DEFAULT_PORTS = {
     'ftp'   : 21,
     'ssh'   : 22,
     'http'  : 80,
     'https' : 443,
     }
+
+  # Builders of the components of lazy furls, keyed by attribute name.
+  _LAZY_COMPONENTS = {
+    '_path': lambda self, path: Path(path, absolute_if_not_empty=True,
+                                     strict=self.strict),
+    '_query': lambda self, query: Query(query, strict=self.strict),
+    '_fragment': lambda self, fragment: Fragment(fragment, strict=self.strict),
+    }
   
-  def __init__(self, url='', strict=False):
+  def __init__(self, url='', strict=False, lazy=False):
     """
     Raises: ValueError on invalid url.
     """
-    PathCompositionInterface.__init__(self, absolute_if_not_empty=True,
-                                      strict=strict)
-    QueryCompositionInterface.__init__(self, strict=strict)
-    FragmentCompositionInterface.__init__(self, strict=strict)
+    if lazy:
+      self._raw = dict.fromkeys(self._LAZY_COMPONENTS, '')
+    else:
+      # Nothing is ever added to _raw, only replaced or popped, so all non-lazy
+      # furls can share one empty dictionary.
+      self._raw = _NOT_LAZY
+      PathCompositionInterface.__init__(self, absolute_if_not_empty=True,
+                                        strict=strict)
+      QueryCompositionInterface.__init__(self, strict=strict)
+      FragmentCompositionInterface.__init__(self, strict=strict)
     self.strict = strict
+    self.lazy = lazy
+    self._cache = None
 
     self.load(str(url)) # Raises ValueError on invalid url.
 
   def load(self, url):
     """
-    Parse and load a URL.
+    Parse and load a URL. If a parse cache is enabled with enable_parse_cache()
+    and <url> has been loaded before, its cached parse is adopted instead. Strict
+    furls never use the cache, so they raise the same UserWarnings whether or not
+    the cache is enabled.
 
     Raises: ValueError on invalid URL (for example malformed IPv6 address or
     invalid port).
     """
+    cache = None if self.strict else _parse_cache
+    if cache is not None:
+      parsed = cache.get((url, False))
+      if parsed is not None:
+        return self._load_parsed(parsed)
+
     self.username = self.password = self.scheme = self._host = ''
     self._port = None
 
-    tokens = urlsplit(url) # Raises ValueError on malformed IPv6 address.
+    # Raises ValueError on malformed IPv6 address.
+    scheme, netloc, path, query, fragment = _split_url(url)
 
-    self.netloc = tokens.netloc # Raises ValueError.
-    self.scheme = tokens.scheme.lower()
+    # <netloc> was already validated by _split_url(), so skip the netloc setter's
+    # validation.
+    self._load_netloc(netloc) # Raises ValueError.
+    pool = _intern_pool
+    if pool is not None:
+      scheme, self._host = pool.intern(scheme), pool.intern(self._host)
+    self.scheme = scheme
     if not self.port:
       self._port = self.DEFAULT_PORTS.get(self.scheme)
-    self.path.load(tokens.path)
-    self.query.load(tokens.query)
-    self.fragment.load(tokens.fragment)
+
+    raw = self._raw
+    for attr, value in (('_path', path), ('_query', query),
+                        ('_fragment', fragment)):
+      if attr in raw and self.lazy: # Not built yet; keep the raw string.
+        raw[attr] = value
+      else:
+        self._component(attr).load(value)
+
+    if cache is not None:
+      cache.put((url, False), self._parsed(path, query, fragment))
     return self
 
+  def _parsed(self, path, query, fragment):
+    """
+    Params:
+      path, query, fragment: The raw component strings just loaded.
+    Returns: Immutable parse of this just loaded furl that _load_parsed() can
+    adopt without parsing. Components that have been built are included as
+    snapshots alongside their raw strings.
+    """
+    components = []
+    for attr, value in (('_path', path), ('_query', query),
+                        ('_fragment', fragment)):
+      snapshot = None
+      if attr not in self._raw:
+        snapshot = getattr(self, attr)._snapshot()
+      components.append((attr, value, snapshot))
+    return (self.scheme, self.username, self.password, self._host, self._port,
+            tuple(components))
+
+  def _load_parsed(self, parsed):
+    """
+    Adopt <parsed>, a parse from _parsed(), just like load() would adopt the URL
+    it was parsed from.
+
+    Returns: <self>.
+    """
+    (self.scheme, self.username, self.password, self._host, self._port,
+     components) = parsed
+    raw = self._raw
+    for attr, value, snapshot in components:
+      if attr in raw and self.lazy:
+        raw[attr] = value
+      elif snapshot is not None:
+        self._component(attr)._restore(snapshot)
+      else:
+        self._component(attr).load(value)
+    return self
+
+  def _component(self, attr):
+    """
+    Returns: The built Path, Query, or Fragment <attr> of this furl, about to be
+    loaded over. Copies that aren't lazy keep snapshots in _raw until their
+    components are accessed; those snapshots are dropped for a new, empty
+    component instead of being restored, so loading parses and warns exactly
+    like it does in furls that weren't copied.
+    """
+    raw = self._raw
+    if attr in raw:
+      del raw[attr]
+      setattr(self, attr, self._LAZY_COMPONENTS[attr](self, ''))
+    return getattr(self, attr)
+
   @property
   def host(self):
     return self._host
@@ -681,7 +1191,7 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
     """
     Raises: ValueError on malformed IPv6 address.
     """
-    urlparse.urlsplit('http://%s/' % host) # Raises ValueError.
+    _check_netloc(host) # Raises ValueError.
     self._host = host
 
   @property
@@ -700,7 +1210,7 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
     if port is None:
       self._port = self.DEFAULT_PORTS.get(self.scheme)
     elif is_valid_port(port):
-      self._port = int(str(port))
+      self._port = port if type(port) is int else int(str(port))
     else:
       raise ValueError("Invalid port: '%s'" % port)
 
@@ -725,39 +1235,25 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
       netloc: Network location string, like 'google.com' or 'google.com:99'.
     Raises: ValueError on invalid port or malformed IPv6 address.
     """
-    # Raises ValueError on malformed IPv6 addresses.
-    urlparse.urlsplit('http://%s/' % netloc)
-    
-    username = password = host = ''
-    port = None
+    # Raises ValueError on invalid port or malformed IPv6 address.
+    self._load_netloc(netloc, check=True)
 
-    if '@' in netloc:
-      userpass, netloc = netloc.split('@', 1)
-      if ':' in userpass:
-        username, password = userpass.split(':', 1)
-      else:
-        username = userpass
-
-    if ':' in netloc:
-      # IPv6 address literal.
-      if ']' in netloc:
-        colonpos, bracketpos = netloc.rfind(':'), netloc.rfind(']')
-        if colonpos > bracketpos and colonpos != bracketpos + 1:
-          raise ValueError("Invalid netloc: '%s'" % netloc)
-        elif colonpos > bracketpos and colonpos == bracketpos + 1:
-          host, port = netloc.rsplit(':', 1)
-        else:
-          host = netloc.lower()
-      else:
-        host, port = netloc.rsplit(':', 1)
-        host = host.lower()
-    else:
-      host = netloc.lower()
+  def _load_netloc(self, netloc, check=False):
+    """
+    Adopt the username, password, host, and port of the network location
+    string <netloc>.
+
+    Params:
+      check: See _parse_netloc().
+    Raises: ValueError on invalid port or malformed IPv6 address.
+    """
+    # Raises ValueError.
+    username, password, host, port = _parse_netloc(netloc, check)
 
-    # Avoid side effects by assigning self.port before self.host so that if an
-    # exception is raised when assigning self.port self.host isn't updated.
-    self.port = port # Raises ValueError on invalid port.
-    self.host = host
+    if port is None:
+      port = self.DEFAULT_PORTS.get(self.scheme)
+    self._port = port
+    self._host = host
     self.username = username
     self.password = password
 
@@ -952,9 +1448,9 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
       password: If True, remove the password, if it exists.
     Returns: <self>.
     """
-    if username:
+    if username is not _absent and username:
       self.username = ''
-    if password:
+    if password is not _absent and password:
       self.password = ''
     if port is not _absent:
       self.port = None
@@ -980,31 +1476,420 @@ class furl(PathCompositionInterface, QueryCompositionInterface,
     return self
 
   def copy(self):
-    return self.__class__(self)
+    """
+    Copy this furl without serializing and parsing it again. The new furl gets
+    immutable snapshots of this furl's Path, Query, and Fragment instead of new
+    objects. Each snapshot is only built into a Path, Query, or Fragment when
+    that component of the new furl is first accessed, so changes to either
+    furl never affect the other. Until then, the new furl's string is built
+    from the snapshotted component strings.
+
+    Returns: A new furl of the same URL.
+    """
+    cls = self.__class__
+    f = cls.__new__(cls)
+    instance_dict = getattr(self, '__dict__', None) # Subclasses without slots.
+    if instance_dict is not None:
+      f.__dict__.update(instance_dict)
+
+    raw = dict(self._raw) # Raw strings and snapshots are immutable.
+    for attr in self._LAZY_COMPONENTS:
+      if attr not in raw:
+        component = getattr(self, attr)
+        separator = getattr(component, 'separator', None)
+        raw[attr] = (str(component), component._snapshot(), separator)
+
+    for attr in ['strict', 'lazy', 'scheme', 'username', 'password', '_host',
+                 '_port', '_cache']:
+      setattr(f, attr, getattr(self, attr))
+    f._raw = raw
+    return f
+
+  def freeze(self):
+    """
+    Returns: A FrozenFurl of this furl's current URL.
+    """
+    return FrozenFurl(self, strict=self.strict)
 
-  def __setattr__(self, attr, value):
-    if (not PathCompositionInterface.__setattr__(self, attr, value) and
-        not QueryCompositionInterface.__setattr__(self, attr, value) and
-        not FragmentCompositionInterface.__setattr__(self, attr, value)):
-      object.__setattr__(self, attr, value)
+  def write_to(self, stream):
+    """
+    Write this furl's URL, the same string as str(self), to <stream>
+    component by component instead of building the URL string first. The
+    query is written with Query.write_to(), so huge query values are encoded
+    in chunks.
+
+    Params:
+      stream: File-like object with a write() method.
+    """
+    # Mirrors urlparse.urlunsplit().
+    scheme, netloc, path = self.scheme, self.netloc, self.pathstr
+    if netloc or (scheme and scheme in urlparse.uses_netloc and
+                  path[:2] != '//'):
+      if path and path[:1] != '/':
+        path = '/' + path
+      path = '//' + netloc + path
+
+    write = stream.write
+    if scheme:
+      write(scheme + ':')
+    write(path)
+    if '_query' in self._raw: # Not built yet.
+      querystr = self._componentstr('_query')
+      if querystr:
+        write('?' + querystr)
+    elif self._query:
+      write('?')
+      self._query.write_to(stream)
+    fragmentstr = self.fragmentstr
+    if fragmentstr:
+      write('#' + fragmentstr)
+
+  @property
+  def pathstr(self):
+    return self._componentstr('_path')
+
+  @property
+  def querystr(self):
+    return self._componentstr('_query')
+
+  @property
+  def fragmentstr(self):
+    return self._componentstr('_fragment')
+
+  def _componentstr(self, attr):
+    """
+    Returns: The string of component <attr>, either its raw or copied string
+    if it hasn't been built yet or the string of its built Path, Query, or
+    Fragment.
+    """
+    raw = self._raw
+    if attr in raw:
+      value = raw[attr]
+      return value[0] if type(value) is tuple else value
+    return str(getattr(self, attr))
+
+  def __getattr__(self, attr):
+    """
+    Only called when <attr> isn't found normally. Builds the Path, Query, or
+    Fragment of a lazy furl from its raw string, or of a copy from its
+    snapshot, on first access.
+    """
+    raw = None
+    if attr in self._LAZY_COMPONENTS: # Guards against recursion on '_raw'.
+      raw = self._raw
+    if not raw or attr not in raw:
+      raise AttributeError(
+        "'%s' object has no attribute '%s'" % (self.__class__.__name__, attr))
+
+    value = raw.pop(attr)
+    if type(value) is tuple: # Snapshot from copy().
+      string, snapshot, separator = value
+      component = self._LAZY_COMPONENTS[attr](self, '')._restore(snapshot)
+      if separator is not None:
+        component.separator = separator
+    else:
+      component = self._LAZY_COMPONENTS[attr](self, value)
+    setattr(self, attr, component)
+    return component
 
   def __str__(self):
-    tokens = (self.scheme, self.netloc, self.pathstr, self.querystr,
-              self.fragmentstr)
-    return urlparse.urlunsplit(tokens)
+    components = (self.scheme, self.username, self.password, self._host,
+                  self._port, self.pathstr, self.querystr, self.fragmentstr)
+    cache = self._cache
+    if cache is None or cache[0] != components:
+      tokens = (self.scheme, self.netloc) + components[5:]
+      cache = self._cache = (components, urlparse.urlunsplit(tokens))
+    return cache[1]
 
   def __repr__(self):
     return "%s('%s')" % (self.__class__.__name__, str(self))
 
 
+class FrozenFurl(object):
+  """
+  Immutable, hashable URL. The URL is parsed and serialized once, on
+  construction, and its string, hash, and origin are kept, so str(), hash(),
+  ==, and dictionary and set lookups never serialize the URL again. FrozenFurls
+  can be shared between threads without copying.
+
+  FrozenFurls are equal if their URL strings are equal. The URL string is the
+  URL as serialized by furl, so
+
+    FrozenFurl('HTTP://www.pumps.com:80/a b') == FrozenFurl(
+      'http://www.pumps.com/a%20b')
+
+  Use thaw() to get a mutable furl of the URL.
+
+  Attributes:
+    url: The URL string, like furl.url.
+    origin: (scheme, host, port) tuple.
+    strict: See furl.strict.
+    scheme, username, password, host, port, netloc: Like furl's.
+    pathstr, querystr, fragmentstr: The encoded path, query, and fragment
+      strings.
+    path, query, args, fragment: New Path, Query, Query.params, and Fragment
+      objects of the path, query, and fragment. Changes to them don't change
+      the FrozenFurl.
+  """
+  __slots__ = ['url', 'origin', 'strict', 'scheme', 'username', 'password',
+               'host', 'port', 'netloc', 'pathstr', 'querystr', 'fragmentstr',
+               '_hash']
+
+  def __init__(self, url='', strict=False):
+    """
+    Params:
+      url: URL string or furl.
+    Raises: ValueError on invalid url.
+    """
+    f = furl(url, strict=strict) # Raises ValueError on invalid url.
+    values = dict(
+      url=str(f), origin=(f.scheme, f.host, f.port), strict=strict,
+      scheme=f.scheme, username=f.username, password=f.password, host=f.host,
+      port=f.port, netloc=f.netloc, pathstr=f.pathstr, querystr=f.querystr,
+      fragmentstr=f.fragmentstr)
+    values['_hash'] = hash(values['url'])
+    for attr, value in values.iteritems():
+      object.__setattr__(self, attr, value)
+
+  @property
+  def path(self):
+    return Path(self.pathstr, absolute_if_not_empty=True, strict=self.strict)
+
+  @property
+  def query(self):
+    return Query(self.querystr, strict=self.strict)
+
+  @property
+  def args(self):
+    return self.query.params
+
+  @property
+  def fragment(self):
+    return Fragment(self.fragmentstr, strict=self.strict)
+
+  def thaw(self):
+    """
+    Returns: A new, mutable furl of this URL.
+    """
+    return furl(self.url, strict=self.strict)
+
+  def write_to(self, stream):
+    stream.write(self.url)
+
+  def __setattr__(self, attr, value):
+    raise AttributeError("'%s' object is immutable" % self.__class__.__name__)
+
+  def __delattr__(self, attr):
+    raise AttributeError("'%s' object is immutable" % self.__class__.__name__)
+
+  def __reduce__(self):
+    return self.__class__, (self.url, self.strict)
+
+  def __copy__(self):
+    return self
+
+  def __deepcopy__(self, memo):
+    return self
+
+  def __hash__(self):
+    return self._hash
+
+  def __eq__(self, other):
+    if not isinstance(other, FrozenFurl):
+      return NotImplemented
+    return self._hash == other._hash and self.url == other.url
+
+  def __ne__(self, other):
+    if not isinstance(other, FrozenFurl):
+      return NotImplemented
+    return self._hash != other._hash or self.url != other.url
+
+  def __str__(self):
+    return self.url
+
+  def __repr__(self):
+    return "%s('%s')" % (self.__class__.__name__, self.url)
+
+
+class URLView(object):
+  """
+  Read-only view of a URL inside a string or a larger buffer, like an
+  mmap.mmap of a log file. Only the buffer and the offsets of the URL's
+  component boundaries are stored. Components are sliced out of the buffer when
+  accessed, and the Path, Query, and Fragment objects behind path, query, args,
+  and fragment are built, anew, on every access.
+
+  Components are parsed exactly like furl.load() parses them, so scheme and
+  host are lowercased and port defaults to the scheme's port in
+  furl.DEFAULT_PORTS. Use furl() to build a full, mutable furl from the view.
+  add(), set(), remove(), and join() do so implicitly: they build a furl from
+  the view, apply the change to it, and return it, leaving the view untouched.
+
+  Attributes:
+    url: The URL string.
+    strict: Passed to the Path, Query, and Fragment objects built from this
+      view. See furl.strict.
+    scheme, username, password, host, port: Like furl's. Accessing username,
+      password, host, or port raises ValueError on invalid port.
+    netloc, pathstr, querystr, fragmentstr: The raw, still encoded, network
+      location, path, query, and fragment strings.
+    path, query, args, fragment: New Path, Query, Query.params, and Fragment
+      objects of the path, query, and fragment.
+  """
+  __slots__ = ['_buf', '_spans', '_netloc', 'strict']
+
+  def __init__(self, buf, start=0, end=None, strict=False):
+    """
+    Params:
+      buf: String or buffer containing the URL, like an mmap.mmap.
+      start, end: Offsets of the URL in <buf>, like slice indices. Defaults to
+        all of <buf>.
+    Raises: ValueError on malformed IPv6 address.
+    """
+    self._buf = buf
+    self._spans = _split_spans(buf, start, end) # Raises ValueError.
+    self._netloc = None
+    self.strict = strict
+
+  @property
+  def url(self):
+    return self._buf[self._spans[0]:self._spans[9]]
+
+  @property
+  def scheme(self):
+    return self._slice(0).lower()
+
+  @property
+  def username(self):
+    return self._netloc_parts()[0]
+
+  @property
+  def password(self):
+    return self._netloc_parts()[1]
+
+  @property
+  def host(self):
+    return self._netloc_parts()[2]
+
+  @property
+  def port(self):
+    port = self._netloc_parts()[3]
+    if not port:
+      port = furl.DEFAULT_PORTS.get(self.scheme)
+    return port
+
+  @property
+  def netloc(self):
+    return self._slice(2)
+
+  @property
+  def pathstr(self):
+    return self._slice(4)
+
+  @property
+  def querystr(self):
+    return self._slice(6)
+
+  @property
+  def fragmentstr(self):
+    return self._slice(8)
+
+  @property
+  def path(self):
+    return Path(self.pathstr, absolute_if_not_empty=True, strict=self.strict)
+
+  @property
+  def query(self):
+    return Query(self.querystr, strict=self.strict)
+
+  @property
+  def args(self):
+    return self.query.params
+
+  @property
+  def fragment(self):
+    return Fragment(self.fragmentstr, strict=self.strict)
+
+  def furl(self):
+    """
+    Returns: A new furl object of this view's URL.
+    """
+    return furl(self.url, strict=self.strict)
+
+  def add(self, *args, **kwargs):
+    """
+    Returns: A new furl of this view's URL with furl.add(*<args>, **<kwargs>)
+    applied.
+    """
+    return self.furl().add(*args, **kwargs)
+
+  def set(self, *args, **kwargs):
+    """
+    Returns: A new furl of this view's URL with furl.set(*<args>, **<kwargs>)
+    applied.
+    """
+    return self.furl().set(*args, **kwargs)
+
+  def remove(self, *args, **kwargs):
+    """
+    Returns: A new furl of this view's URL with furl.remove(*<args>,
+    **<kwargs>) applied.
+    """
+    return self.furl().remove(*args, **kwargs)
+
+  def join(self, url):
+    """
+    Returns: A new furl of this view's URL joined with <url>.
+    """
+    return self.furl().join(url)
+
+  def _slice(self, i):
+    return self._buf[self._spans[i]:self._spans[i + 1]]
+
+  def _netloc_parts(self):
+    """
+    Returns: The (username, password, host, port) tuple of the netloc, parsed
+    once on first access.
+
+    Raises: ValueError on invalid port.
+    """
+    if self._netloc is None:
+      self._netloc = _parse_netloc(self._slice(2)) # Raises ValueError.
+    return self._netloc
+
+  def __str__(self):
+    return self.url
+
+  def __repr__(self):
+    return "%s('%s')" % (self.__class__.__name__, self.url)
+
+def view(url, strict=False):
+  """
+  Split <url> into a read-only URLView instead of a furl. Only the offsets of
+  the component boundaries are computed; components are sliced out of <url>,
+  and decoded, only when accessed. Mutating the view with add(), set(),
+  remove(), or join() returns a full furl.
+
+  Example:
+    v = view('http://www.pumps.com/a/b?c=d')
+    if v.host == 'www.pumps.com':
+      f = v.set(scheme='https') # f is a furl.
+
+  Returns: URLView of <url>.
+
+  Raises: ValueError on malformed IPv6 address.
+  """
+  return URLView(str(url), strict=strict)
+
+
 """
-urlparse.urlsplit() and urlparse.urljoin() don't separate the query string from
-the path for schemes not in the list urlparse.uses_query, but furl should
-support proper parsing of query strings and paths for all schemes users may use.
+urlparse.urljoin() doesn't separate the query string from the path for schemes
+not in the list urlparse.uses_query, but furl should support proper parsing of
+query strings and paths for all schemes users may use.
 
 As a workaround, use 'http' (a scheme in urlparse.uses_query) for the purposes
-of urlparse.urlsplit() and urlparse.urljoin(), but then revert back to the
-original scheme provided once urlsplit() or urljoin() has completed.
+of urlparse.urljoin(), but then revert back to the original scheme provided once
+urljoin() has completed.
 
 _get_scheme() and _change_scheme() are helper methods for getting and setting
 the scheme of URL strings. Used to change the scheme to 'http' and back again.
@@ -1036,6 +1921,156 @@ def urljoin(base, url):
     joined = _set_scheme(joined, base_scheme)
   return joined
 
+SCHEME_REGEX = re.compile(r'[a-zA-Z0-9+\-.]*\Z')
+PORT_REGEX = re.compile(r'[0-9]+\Z')
+
+def _split_spans(buf, start=0, end=None):
+  """
+  Find the boundaries of the scheme, netloc, path, query, and fragment of the
+  URL buf[start:end] in a single left to right pass. Only the scheme and netloc
+  are sliced out of <buf>, to be validated, so <buf> can also be a large buffer
+  with string-like find() and slicing, like an mmap.mmap.
+
+  The query is separated from the path for every scheme, known or not, so
+  'unknown://www.yahoo.com?a=a' has the query 'a=a' just like 'http' URLs do.
+
+  Otherwise the rules are those of urlparse.urlsplit(): 'host:1234' is a path,
+  not the scheme 'host' followed by the path '1234', except that, just like in
+  urlparse.urlsplit(), 'http' is always a scheme, so 'http:80' is the scheme
+  'http' followed by the path '80'. Schemes followed by '//'
+  are accepted as is, like 'my_scheme://host', as long as they don't contain a
+  '/', '?', or '#'.
+
+  <start> and <end> are interpreted like slice indices, so they can be negative
+  or out of range.
+
+  Returns: Tuple of the start and end offsets in <buf> of the scheme, netloc,
+  path, query, and fragment, in that order, like (scheme start, scheme end,
+  netloc start, netloc end, ...). Missing components have equal start and end
+  offsets. All offsets are non-negative.
+
+  Raises: ValueError on malformed IPv6 address.
+  """
+  start, end, _ = slice(start, end).indices(len(buf))
+  end = max(start, end)
+  urlend, schemeend, pos = end, start, start
+
+  colon = buf.find(':', start, end)
+  if colon > start:
+    if colon + 3 <= end and buf[colon + 1:colon + 3] == '//':
+      candidate = buf[start:colon]
+      if '/' not in candidate and '?' not in candidate and '#' not in candidate:
+        schemeend = pos = colon
+    # Make sure the text after the ':' isn't a port, in which case the
+    # candidate scheme is really part of the path, like 'host:1234'.
+    # urlparse.urlsplit() skips this check for 'http'.
+    elif ((colon - start == 4 and buf[start:colon] == 'http') or
+          (SCHEME_REGEX.match(buf, start, colon) and
+           not PORT_REGEX.match(buf, colon + 1, end))):
+      schemeend = pos = colon
+    if schemeend == colon:
+      pos += 1
+
+  fragmentstart = end
+  hashpos = buf.find('#', pos, end)
+  if hashpos >= 0:
+    fragmentstart, end = hashpos + 1, hashpos
+
+  querystart = pathend = buf.find('?', pos, end)
+  if pathend >= 0:
+    querystart += 1
+  else:
+    querystart = pathend = end
+
+  netlocstart = netlocend = pos
+  if pos + 2 <= pathend and buf[pos:pos + 2] == '//':
+    netlocstart, netlocend = pos + 2, buf.find('/', pos + 2, pathend)
+    if netlocend < 0:
+      netlocend = pathend
+    _check_netloc(buf[netlocstart:netlocend]) # Raises ValueError.
+    pos = netlocend
+
+  return (start, schemeend, netlocstart, netlocend, pos, pathend, querystart,
+          end, fragmentstart, urlend)
+
+def _split_url(url):
+  """
+  Split the URL string <url> into its scheme, netloc, path, query, and fragment
+  components with _split_spans(). The scheme is lowercased.
+
+  Returns: Tuple (scheme, netloc, path, query, fragment).
+
+  Raises: ValueError on malformed IPv6 address.
+  """
+  spans = _split_spans(url) # Raises ValueError.
+  return (url[spans[0]:spans[1]].lower(), url[spans[2]:spans[3]],
+          url[spans[4]:spans[5]], url[spans[6]:spans[7]],
+          url[spans[8]:spans[9]])
+
+def _check_netloc(netloc):
+  """
+  Raises: ValueError on malformed IPv6 address, like a '[' without a matching
+  ']'. This is the same check urlparse.urlsplit() performs on network locations.
+  """
+  if ('[' in netloc) != (']' in netloc):
+    raise ValueError("Invalid IPv6 URL")
+
+def _parse_netloc(netloc, check=False):
+  """
+  Parse the network location string <netloc> by locating its '@', ':', and ']'
+  delimiters once each, slicing out only the username, password, host, and
+  port strings, and converting the port to an integer once. Hosts other than
+  IPv6 address literals with a port are lowercased.
+
+  Params:
+    check: Boolean whether or not to first check all of <netloc> for a
+      malformed IPv6 address like _check_netloc() does. Network locations split
+      from URLs by _split_url() are already checked. The host is always checked,
+      since brackets in the username and password can balance unmatched
+      brackets in the host, like in '[@host]'.
+  Returns: Tuple (username, password, host, port). <port> is an integer, or None
+  if <netloc> has no port.
+
+  Raises: ValueError on invalid port or malformed IPv6 address.
+  """
+  if check and ('[' in netloc) != (']' in netloc):
+    raise ValueError("Invalid IPv6 URL")
+
+  username = password = ''
+  port = None
+
+  at = netloc.find('@')
+  if at >= 0:
+    colon = netloc.find(':', 0, at)
+    if colon >= 0:
+      username, password = netloc[:colon], netloc[colon + 1:at]
+    else:
+      username = netloc[:at]
+    netloc = netloc[at + 1:]
+
+  colon = netloc.rfind(':')
+  if colon < 0:
+    host = netloc.lower()
+  else:
+    bracket = netloc.rfind(']')
+    if bracket < 0:
+      host, port = netloc[:colon].lower(), netloc[colon + 1:]
+    elif colon < bracket: # IPv6 address literal without a port.
+      host = netloc.lower()
+    elif colon == bracket + 1: # IPv6 address literal with a port.
+      host, port = netloc[:colon], netloc[colon + 1:]
+    else:
+      raise ValueError("Invalid netloc: '%s'" % netloc)
+  _check_netloc(host) # Raises ValueError.
+
+  if port is not None:
+    number = int(port) if port.isdigit() else 0
+    if not 0 < number <= 65535:
+      raise ValueError("Invalid port: '%s'" % port)
+    port = number
+
+  return username, password, host, port
+
 def urlsplit(url):
   """
   Parameters:
@@ -1046,20 +2081,339 @@ def urlsplit(url):
   password, hostname, port). See the url below for more details on urlsplit().
 
     http://docs.python.org/library/urlparse.html#urlparse.urlsplit
+
+  Unlike urlparse.urlsplit(), the query is split from the path for all schemes,
+  not just those in urlparse.uses_query. See _split_url().
+
+  Raises: ValueError on malformed IPv6 address.
   """
-  # If a scheme wasn't provided, we shouldn't add one by setting the scheme to
-  # 'http'. We can use urlparse.urlsplit(url) as-is.
-  if '://' not in url:
-    return urlparse.urlsplit(url)
-  
-  def _change_urltoks_scheme(tup, scheme):
-    l = list(tup)
-    l[0] = scheme
-    return tuple(l)
+  cache = _parse_cache
+  if cache is None:
+    return urlparse.SplitResult(*_split_url(url))
+
+  key = (url, None)
+  tokens = cache.get(key)
+  if tokens is None:
+    tokens = urlparse.SplitResult(*_split_url(url))
+    cache.put(key, tokens)
+  return tokens
+
+ParsedURL = namedtuple('ParsedURL', ['scheme', 'username', 'password', 'host',
+                                     'port', 'path', 'query', 'fragment'])
+
+def parse_many(urls, strict=False):
+  """
+  Parse many URLs without building a furl, Path, Query, or Fragment object for
+  each of them.
+
+  Each URL is parsed and decoded exactly like furl.load() would parse and decode
+  it. So, for every url
+
+    f = furl(url)
+    parsed = next(parse_many([url]))
+
+    (parsed.scheme, parsed.username, parsed.password, parsed.host,
+     parsed.port) == (f.scheme, f.username, f.password, f.host, f.port)
+    list(parsed.path) == f.path.segments
+    list(parsed.query) == f.query.params.allitems()
+
+  ParsedURL.fragment is the raw, still encoded, fragment string.
+
+  Params:
+    urls: Iterable of URLs.
+    strict: Boolean whether or not UserWarnings should be raised for improperly
+      encoded paths and queries, just like furl.strict.
+  Returns: Generator of ParsedURL namedtuples, one for each URL in <urls>, with
+  fields (scheme, username, password, host, port, path, query, fragment). <path>
+  is a tuple of decoded path segments and <query> a tuple of decoded (key,
+  value) query pairs.
+
+  Raises: ValueError on invalid URL (for example malformed IPv6 address or
+  invalid port).
+  """
+  # One Path and Query are reused to decode the paths and queries of all URLs.
+  path = Path(absolute_if_not_empty=True, strict=strict)
+  query = Query(strict=strict)
+  default_ports = furl.DEFAULT_PORTS
+
+  for url in urls:
+    # Raises ValueError on malformed IPv6 address.
+    scheme, netloc, pathstr, querystr, fragment = _split_url(str(url))
+    # Raises ValueError on invalid port.
+    username, password, host, port = _parse_netloc(netloc)
+    if not port:
+      port = default_ports.get(scheme)
+    pool = _intern_pool
+    if pool is not None:
+      scheme, host = pool.intern(scheme), pool.intern(host)
+    yield ParsedURL(scheme, username, password, host, port,
+                    tuple(path.load(pathstr).segments),
+                    tuple(query._items(querystr)), fragment)
+
+def write_many(furls, stream, separator='\n'):
+  """
+  Write each URL in <furls>, followed by <separator>, to <stream>. furl and
+  FrozenFurl objects are written with their write_to() method, so no
+  intermediate URL strings are built for them; anything else is written as
+  str() of it.
+
+  Example:
+    with open('urls.txt', 'wb') as f:
+      furl.write_many((u.set(scheme='https') for u in furls), f)
+
+  Params:
+    furls: Iterable of furls, FrozenFurls, or URL strings.
+    stream: File-like object with a write() method.
+    separator: String written after each URL.
+  Returns: The number of URLs written.
+  """
+  write = stream.write
+  count = 0
+  for f in furls:
+    write_to = getattr(f, 'write_to', None)
+    if write_to is not None:
+      write_to(stream)
+    else:
+      write(str(f))
+    write(separator)
+    count += 1
+  return count
+
+ParseCacheInfo = namedtuple(
+  'ParseCacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+class ParseCache(object):
+  """
+  Bounded cache of parsed URLs. Once <maxsize> entries are cached, the least
+  recently used entry is evicted to make room for each new entry.
+
+  Cached values are immutable parses, never furl objects, so furls loaded from
+  the cache share no state with each other or with the cache. Thread safe.
+
+  Attributes:
+    maxsize: Maximum number of cached entries. Lowering maxsize evicts the least
+      recently used entries until the cache fits.
+    hits: Number of lookups that found a cached entry.
+    misses: Number of lookups that didn't.
+    evictions: Number of entries evicted to make room for newer entries.
+  """
+  def __init__(self, maxsize=1024):
+    """
+    Raises: ValueError on invalid maxsize.
+    """
+    self._lock = threading.Lock()
+    self._entries = odict()
+    self.hits = self.misses = self.evictions = 0
+    self.maxsize = maxsize
+
+  @property
+  def maxsize(self):
+    return self._maxsize
+
+  @maxsize.setter
+  def maxsize(self, maxsize):
+    """
+    Raises: ValueError on invalid maxsize.
+    """
+    if not isinstance(maxsize, (int, long)) or maxsize < 1:
+      raise ValueError("Invalid maxsize: '%s'" % maxsize)
+    with self._lock:
+      self._maxsize = maxsize
+      self._evict(maxsize)
+
+  def get(self, key):
+    """
+    Returns: The value cached for <key>, or None if there is none.
+    """
+    with self._lock:
+      value = self._entries.pop(key, None)
+      if value is None:
+        self.misses += 1
+      else:
+        self._entries[key] = value # Now the most recently used entry.
+        self.hits += 1
+      return value
+
+  def put(self, key, value):
+    """
+    Cache <value> for <key>, evicting the least recently used entry if the
+    cache is full.
+    """
+    with self._lock:
+      self._entries.pop(key, None)
+      self._evict(self._maxsize - 1)
+      self._entries[key] = value
+
+  def clear(self):
+    """
+    Remove all entries and reset the hit, miss, and eviction counters.
+    """
+    with self._lock:
+      self._entries.clear()
+      self.hits = self.misses = self.evictions = 0
+
+  def info(self):
+    """
+    Returns: ParseCacheInfo namedtuple of this cache's statistics.
+    """
+    with self._lock:
+      return ParseCacheInfo(self.hits, self.misses, self.evictions,
+                            self._maxsize, len(self._entries))
+
+  def _evict(self, size):
+    while len(self._entries) > size:
+      self._entries.popitem(last=False)
+      self.evictions += 1
+
+  def __len__(self):
+    return len(self._entries)
+
+
+# The process wide parse cache, consulted by furl.load() and urlsplit(). None
+# if disabled.
+_parse_cache = None
+
+def enable_parse_cache(maxsize=1024):
+  """
+  Enable a process wide ParseCache of up to <maxsize> URLs, replacing any
+  existing parse cache. Until disabled, furl.load() and urlsplit() consult the
+  cache before parsing. furls with strict=True always parse, so they raise their
+  UserWarnings on every load().
+
+  Returns: The new ParseCache.
+
+  Raises: ValueError on invalid maxsize.
+  """
+  global _parse_cache
+  _parse_cache = ParseCache(maxsize)
+  return _parse_cache
+
+def disable_parse_cache():
+  """
+  Disable and discard the process wide parse cache, if enabled.
+  """
+  global _parse_cache
+  _parse_cache = None
+
+def parse_cache_info():
+  """
+  Returns: ParseCacheInfo namedtuple of the process wide parse cache's
+  statistics, or None if the parse cache is disabled.
+  """
+  cache = _parse_cache
+  return cache.info() if cache is not None else None
+
+class InternPoolInfo(namedtuple(
+    'InternPoolInfo', ['hits', 'misses', 'maxsize', 'currsize'])):
+  __slots__ = ()
+
+  @property
+  def hitrate(self):
+    """
+    Returns: Fraction of lookups that found a pooled string, from 0.0 to 1.0.
+    """
+    lookups = self.hits + self.misses
+    return float(self.hits) / lookups if lookups else 0.0
+
+class InternPool(object):
+  """
+  Bounded pool of strings used to deduplicate the hosts, schemes, path
+  segments, and query keys that are parsed again and again from different URLs,
+  like 'www.google.com', 'api', or 'utm_source'. Equal strings that pass through
+  the pool become the same string object, so they're stored once and compare by
+  identity first.
+
+  Unlike the builtin intern(), the pool is bounded and counts its hits and
+  misses. Once <maxsize> strings are pooled, new strings are returned unpooled;
+  the pool never evicts. Strings longer than <maxlength> characters are never
+  pooled. Lookups take no lock, so under concurrent use the hit and miss
+  counters are approximate.
+
+  Attributes:
+    maxsize: Maximum number of pooled strings.
+    maxlength: Maximum length of pooled strings.
+    hits: Number of lookups that found a pooled string.
+    misses: Number of lookups that didn't.
+  """
+  def __init__(self, maxsize=65536, maxlength=64):
+    """
+    Raises: ValueError on invalid maxsize or maxlength.
+    """
+    for name, value in (('maxsize', maxsize), ('maxlength', maxlength)):
+      if not isinstance(value, (int, long)) or value < 1:
+        raise ValueError("Invalid %s: '%s'" % (name, value))
+    self.maxsize = maxsize
+    self.maxlength = maxlength
+    self._strings = {}
+    self.hits = self.misses = 0
+
+  def intern(self, s):
+    """
+    Returns: The pooled string equal to <s>, or <s> itself if there is none.
+    <s> is added to the pool if it isn't full and <s> is short enough.
+    """
+    pooled = self._strings.get(s)
+    if pooled is not None:
+      self.hits += 1
+      return pooled
+    self.misses += 1
+    if len(self._strings) < self.maxsize and len(s) <= self.maxlength:
+      self._strings[s] = s
+    return s
+
+  def clear(self):
+    """
+    Remove all pooled strings and reset the hit and miss counters.
+    """
+    self._strings = {}
+    self.hits = self.misses = 0
+
+  def info(self):
+    """
+    Returns: InternPoolInfo namedtuple of this pool's statistics.
+    """
+    return InternPoolInfo(self.hits, self.misses, self.maxsize,
+                          len(self._strings))
 
-  original_scheme = _get_scheme(url)
-  toks = urlparse.urlsplit(_set_scheme(url, 'http'))
-  return urlparse.SplitResult(*_change_urltoks_scheme(toks, original_scheme))
+  def __len__(self):
+    return len(self._strings)
+
+
+# The process wide intern pool, used by furl.load(), Path.load(),
+# Query._items(), and parse_many(). None if disabled.
+_intern_pool = None
+
+def enable_intern_pool(maxsize=65536, maxlength=64):
+  """
+  Enable a process wide InternPool of up to <maxsize> strings of up to
+  <maxlength> characters each, replacing any existing intern pool. Until
+  disabled, the schemes and hosts loaded by furl.load() and parse_many(), the
+  path segments loaded by Path.load(), and the query keys parsed from query
+  strings by Query are pooled.
+
+  Returns: The new InternPool.
+
+  Raises: ValueError on invalid maxsize or maxlength.
+  """
+  global _intern_pool
+  _intern_pool = InternPool(maxsize, maxlength)
+  return _intern_pool
+
+def disable_intern_pool():
+  """
+  Disable and discard the process wide intern pool, if enabled. Strings already
+  pooled stay shared by the objects that hold them.
+  """
+  global _intern_pool
+  _intern_pool = None
+
+def intern_pool_info():
+  """
+  Returns: InternPoolInfo namedtuple of the process wide intern pool's
+  statistics, or None if the intern pool is disabled.
+  """
+  pool = _intern_pool
+  return pool.info() if pool is not None else None
 
 def join_path_segments(*args):
   """
@@ -1137,10 +2491,12 @@ def remove_path_segments(segments, remove):
   return ret
 
 def is_valid_port(port):
-  port = str(port)
-  if not port.isdigit() or int(port) == 0 or int(port) > 65535:
-    return False
-  return True
+  if type(port) is not int:
+    port = str(port)
+    if not port.isdigit():
+      return False
+    port = int(port)
+  return 0 < port <= 65535
 
 #
 # TODO(grun): These functions need to be expanded to reflect the fact that the
@@ -1193,3 +2549,86 @@ VALID_ENCODED_QUERY_VALUE_REGEX = re.compile(
   r'^([\w\-\.\~\:\@\!\$\&\'\(\)\*\+\,\;\/\?\=]|(\%[\da-fA-F][\da-fA-F]))*$')
 def is_valid_encoded_query_value(value):
   return bool(VALID_ENCODED_QUERY_VALUE_REGEX.match(value))
+
+def _split_pairs(query, delimeter=None):
+  """
+  Returns: List of the encoded 'key=value' pair strings of the encoded query
+  string <query>, including empty ones, split on <delimeter> or, if
+  <delimeter> is None, on both '&' and ';'.
+  """
+  if delimeter is not None:
+    return query.split(delimeter)
+  elif ';' in query:
+    return query.replace(';', '&').split('&')
+  return query.split('&')
+
+def _decode_pair(pairstr):
+  """
+  Returns: The unquoted (key, value) tuple of the encoded 'key=value' pair
+  string <pairstr>, unquoted like urlparse.parse_qsl() unquotes pairs. Keys and
+  values without '%' or '+' need no unquoting and are used as is. Keys are
+  interned if an intern pool is enabled with enable_intern_pool().
+  """
+  key, sep, value = pairstr.partition('=')
+  if not sep:
+    value = ''
+
+  if '+' in key:
+    key = urlparse.unquote(key.replace('+', ' '))
+  elif '%' in key:
+    key = urlparse.unquote(key)
+  if '+' in value:
+    value = urlparse.unquote(value.replace('+', ' '))
+  elif '%' in value:
+    value = urlparse.unquote(value)
+
+  pool = _intern_pool
+  if pool is not None:
+    key = pool.intern(key)
+  return key, value
+
+def _encode_pair(key, value, safe_key_chars, safe_value_chars):
+  """
+  Returns: The encoded 'key=value' pair string of <key> and <value>, quoted
+  with urllib.quote_plus() and the safe characters <safe_key_chars> and
+  <safe_value_chars>.
+  """
+  return '='.join((urllib.quote_plus(str(key), safe_key_chars),
+                   urllib.quote_plus(str(value), safe_value_chars)))
+
+# Characters that urllib.quote_plus() never quotes.
+_ALWAYS_SAFE = ('ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                'abcdefghijklmnopqrstuvwxyz'
+                '0123456789_.-')
+
+_canonical_pair_regexes = {}
+def _canonical_pair_regex(safe_key_chars, safe_value_chars):
+  """
+  Returns: Compiled regular expression that matches the encoded 'key=value'
+  pair strings that decode and encode back to themselves, exactly as they are,
+  when keys are encoded with urllib.quote_plus(key, <safe_key_chars>) and
+  values with urllib.quote_plus(value, <safe_value_chars>).
+  """
+  regex = _canonical_pair_regexes.get((safe_key_chars, safe_value_chars))
+  if regex is None:
+    regex = re.compile(r'%s=%s\Z' % (_canonical_component(safe_key_chars, True),
+                                      _canonical_component(safe_value_chars)))
+    _canonical_pair_regexes[(safe_key_chars, safe_value_chars)] = regex
+  return regex
+
+def _canonical_component(safe_chars, iskey=False):
+  """
+  Returns: Regular expression pattern of the strings that quote_plus(s,
+  <safe_chars>) returns: safe characters, '+' for spaces, and uppercase '%XX'
+  escapes of all other characters. Keys can't contain '=', which ends them.
+  """
+  safe = set(_ALWAYS_SAFE + safe_chars)
+  literals = safe - set('=') if iskey else safe
+  escapes = []
+  for high in '0123456789ABCDEF':
+    lows = ''.join(low for low in '0123456789ABCDEF'
+                   if chr(int(high + low, 16)) not in safe | set(' '))
+    if lows:
+      escapes.append('%s[%s]' % (high, lows))
+  return r'(?:[%s\+]|%%(?:%s))*' % (
+    ''.join(re.escape(c) for c in sorted(literals)), '|'.join(escapes))
@@ -0,0 +1,74 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import os
+import re
+import mmap
+
+from .furl import URLView
+
+# Request target of the quoted request line in Common and Combined Log Format
+# access logs, like the '/a?b=c' in '"GET /a?b=c HTTP/1.1"'.
+REQUEST_REGEX = re.compile(r'"[A-Z]+ ([^ "]+)(?: [A-Z]+/[0-9.]+)?"')
+
+def scan(log, regex=REQUEST_REGEX, strict=False, skip_invalid=False):
+  """
+  Memory-map the log file <log> and find the URLs in it by scanning its bytes
+  with <regex>, without reading the log into lines or strings first.
+
+  Each URL found is yielded as a URLView of the memory-mapped log, so only the
+  components of each URL that are accessed are ever copied out of the log.
+
+  Example:
+    hosts = collections.Counter(
+      view.host for view in furl.logscan.scan('access.log'))
+
+  Params:
+    log: Path of, or file object opened on, the log file.
+    regex: Compiled regular expression or pattern string whose first group
+      matches a URL. Defaults to REQUEST_REGEX, the request target of access
+      logs.
+    strict: Passed to each URLView. See furl.strict.
+    skip_invalid: Boolean whether or not to skip URLs with malformed IPv6
+      addresses instead of raising ValueError.
+  Returns: Iterator of URLView objects, one per URL found, in log order. The
+  views keep the memory map open for as long as they're referenced.
+
+  Raises: ValueError on a URL with malformed IPv6 address if <skip_invalid> is
+  False.
+  """
+  if isinstance(regex, basestring):
+    regex = re.compile(regex)
+
+  buf = _mmap(log)
+  if buf is None: # Empty log.
+    return
+
+  for match in regex.finditer(buf):
+    start, end = match.span(1)
+    try:
+      view = URLView(buf, start, end, strict=strict)
+    except ValueError:
+      if skip_invalid:
+        continue
+      raise
+    yield view
+
+def _mmap(log):
+  """
+  Returns: Read only mmap.mmap of the file <log>, a path or file object, or
+  None if <log> is empty, as empty files can't be memory-mapped.
+  """
+  if isinstance(log, basestring):
+    with open(log, 'rb') as fileobj:
+      return _mmap(fileobj)
+
+  if os.fstat(log.fileno()).st_size == 0:
+    return None
+  return mmap.mmap(log.fileno(), 0, access=mmap.ACCESS_READ)
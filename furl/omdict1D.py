@@ -7,9 +7,14 @@
 #
 # License: Build Amazing Things (Unlicense)
 
-from itertools import chain
+from itertools import chain, izip
 
 from orderedmultidict import omdict
+from orderedmultidict.orderedmultidict import _absent
+
+# Types of values that are never lists of values, so they're always added as
+# a single value.
+_SCALARS = frozenset([str, unicode, int, long, float, bool, type(None)])
 
 class omdict1D(omdict):
   """
@@ -38,15 +43,168 @@ class omdict1D(omdict):
     omd = omdict([(1,None),(2,None)])
     omd.updateall([(1,[1,11]), (2,[2,22])])
     omd.allitems == [(1,1), (1,11), (2,2), (2,22)]
+
+  Items are stored in parallel arrays instead of omdict's linked list of one
+  node object per item. Removed items and keys are marked with _absent and the
+  arrays are compacted once over half of their entries are removed, so
+  removals take amortized constant time per item.
+
+  Attributes:
+    _keys: List of the key of each item, in order. _absent if removed.
+    _values: List of the value of each item, parallel to _keys.
+    _map: Dictionary of each key's list of positions of its items in _keys and
+      _values, in order.
+    _order: List of the keys, in order. _absent if removed.
+    _orderindex: Dictionary of each key's position in _order.
+    _dead: Number of removed items in _keys and _values.
   """
+  def __init__(self, *args, **kwargs):
+    self.load(*args, **kwargs)
+
+  def load(self, *args, **kwargs):
+    """
+    Subclassed from omdict.load() to append a list or tuple of (key, value)
+    items that are all single values, like parsed query strings, directly
+    instead of binning each item with updateall().
+    """
+    self.clear()
+    if len(args) == 1 and not kwargs and type(args[0]) in (list, tuple):
+      if self._append_scalars(args[0]) == len(args[0]):
+        return self
+      self.clear()
+    self.updateall(*args, **kwargs)
+    return self
+
+  def additems(self, items):
+    """
+    Add each (key, value) item of <items> with add(), in order. Like
+    Query.params assignment, which clears the dictionary first.
+
+    Example:
+      omd = omdict1D([(1,1)])
+      omd.additems([(2,2), (1,[11,111]), (3,[])])
+      omd.allitems() == [(1,1), (2,2), (1,11), (1,111)]
+
+    Returns: <self>.
+    """
+    if type(items) not in (list, tuple):
+      items = list(items)
+    for key, value in items[self._append_scalars(items):]:
+      self.add(key, value)
+    return self
+
+  def _append_scalars(self, items):
+    """
+    Append the (key, value) items of the list or tuple <items> until a value
+    that isn't a _SCALARS value is reached.
+
+    Returns: The number of items appended.
+    """
+    keys, values, positions = self._keys, self._values, self._map
+    order, orderindex = self._order, self._orderindex
+    for count, (key, value) in enumerate(items):
+      if type(value) not in _SCALARS:
+        return count
+      keypositions = positions.get(key)
+      if keypositions is None:
+        positions[key] = [len(keys)]
+        orderindex[key] = len(order)
+        order.append(key)
+      else:
+        keypositions.append(len(keys))
+      keys.append(key)
+      values.append(value)
+    return len(items)
+
+  def _append(self, key, value):
+    positions = self._map.get(key)
+    if positions is None:
+      positions = self._map[key] = []
+      self._orderindex[key] = len(self._order)
+      self._order.append(key)
+    positions.append(len(self._keys))
+    self._keys.append(key)
+    self._values.append(value)
+
+  def _discard(self, positions):
+    """
+    Mark the items at <positions> removed. The caller removes <positions> from
+    the key's list of positions.
+    """
+    keys, values = self._keys, self._values
+    for position in positions:
+      keys[position] = _absent
+      values[position] = None
+    self._dead += len(positions)
+
+  def _delkey(self, key):
+    del self._map[key]
+    self._order[self._orderindex.pop(key)] = _absent
+
+  def _compact(self, force=False):
+    """
+    Drop the removed items and keys from the arrays, if over half of their
+    entries are removed or if <force> is True. Lists of positions are updated
+    in place.
+    """
+    keys = self._keys
+    if self._dead and (force or (self._dead > 16 and
+                                 2 * self._dead > len(keys))):
+      live = [(key, value) for key, value in izip(keys, self._values)
+              if key is not _absent]
+      self._keys = [key for key, value in live]
+      self._values = [value for key, value in live]
+      positions = self._map
+      for keypositions in positions.itervalues():
+        del keypositions[:]
+      for position, key in enumerate(self._keys):
+        positions[key].append(position)
+      self._dead = 0
+
+    order = self._order
+    deadkeys = len(order) - len(self._map)
+    if deadkeys and (force or (deadkeys > 16 and 2 * deadkeys > len(order))):
+      self._order = [key for key in order if key is not _absent]
+      for index, key in enumerate(self._order):
+        self._orderindex[key] = index
+
+  def _edge(self, keys, last):
+    """
+    Returns: The first, or last if <last> is True, key in <keys> that isn't
+    _absent.
+    """
+    for key in (reversed(keys) if last else keys):
+      if key is not _absent:
+        return key
+
+  def clear(self):
+    self._keys, self._values = [], []
+    self._map, self._order, self._orderindex = {}, [], {}
+    self._dead = 0
+
+  def size(self):
+    return len(self._keys) - self._dead
+
+  def get(self, key, default=None):
+    positions = self._map.get(key)
+    if positions is None:
+      return default
+    return self._values[positions[0]]
+
+  def getlist(self, key, default=[]):
+    positions = self._map.get(key)
+    if positions is None:
+      return default
+    values = self._values
+    return [values[position] for position in positions]
+
   def add(self, key, value=[]):
-    if not self._quacks_like_a_list_but_not_str(value):
-      value = [value]
-    if value:
-      self._map.setdefault(key, [])
-    for val in value:
-      node = self._items.append(key, val)
-      self._map[key].append(node)
+    if (type(value) in _SCALARS or
+        not self._quacks_like_a_list_but_not_str(value)):
+      self._append(key, value)
+    else:
+      for val in value:
+        self._append(key, val)
     return self
 
   def set(self, key, value=[None]):
@@ -55,38 +213,197 @@ class omdict1D(omdict):
   def __setitem__(self, key, value):
     return self._set(key, value)
 
+  def setlist(self, key, values):
+    values = list(values)
+    positions = self._map.get(key, [])
+    _values = self._values
+    for position, value in izip(positions, values):
+      _values[position] = value
+    if len(values) > len(positions):
+      for value in values[len(positions):]:
+        self.add(key, value)
+    elif len(values) < len(positions):
+      self._discard(positions[len(values):])
+      del positions[len(values):]
+      if not positions:
+        self._delkey(key)
+      self._compact()
+    return self
+
+  def poplist(self, key, default=_absent):
+    positions = self._map.get(key)
+    if positions is not None:
+      values = self.getlist(key)
+      self._discard(positions)
+      self._delkey(key)
+      self._compact()
+      return values
+    elif default is not _absent:
+      return default
+    raise KeyError(key)
+
+  def popvalue(self, key, value=_absent, default=_absent, last=True):
+    positions = self._map.get(key)
+    if positions is not None:
+      if value is not _absent:
+        values = self.getlist(key)
+        if last:
+          index = len(values) - 1 - values[::-1].index(value) # ValueError.
+        else:
+          index = values.index(value) # Raises ValueError.
+      else:
+        index = -1 if last else 0
+      position = positions.pop(index)
+      value = self._values[position]
+      self._discard([position])
+      if not positions:
+        self._delkey(key)
+      self._compact()
+      return value
+    elif default is not _absent:
+      return default
+    raise KeyError(key)
+
+  def popitem(self, fromall=False, last=True):
+    if not self._map:
+      raise KeyError('popitem(): %s is empty' % self.__class__.__name__)
+    if fromall:
+      key = self._edge(self._keys, last)
+      return key, self.popvalue(key, last=last)
+    key = self._edge(self._order, last)
+    return key, self.pop(key)
+
+  def poplistitem(self, last=True):
+    if not self._map:
+      s = 'poplistitem(): %s is empty' % self.__class__.__name__
+      raise KeyError(s)
+    key = self._edge(self._order, last)
+    return key, self.poplist(key)
+
+  def iteritems(self, key=_absent):
+    if key is not _absent:
+      positions = self._map.get(key)
+      if positions is None:
+        raise KeyError(key)
+      keys, values = self._keys, self._values
+      return iter([(keys[position], values[position])
+                   for position in positions])
+    positions, values = self._map, self._values
+    return iter([(key, values[positions[key][0]]) for key in self.iterkeys()])
+
+  def iterkeys(self):
+    if len(self._order) == len(self._map):
+      return iter(self._order)
+    return (key for key in self._order if key is not _absent)
+
+  def itervalues(self, key=_absent):
+    if key is not _absent:
+      if key in self._map:
+        return iter(self.getlist(key))
+      raise KeyError(key)
+    positions, values = self._map, self._values
+    return iter([values[positions[key][0]] for key in self.iterkeys()])
+
+  def iterallitems(self, key=_absent):
+    if key is not _absent:
+      return self.iteritems(key) # Raises KeyError if <key> isn't a key.
+    if not self._dead:
+      return izip(self._keys, self._values)
+    return ((key, value) for key, value in izip(self._keys, self._values)
+            if key is not _absent)
+
+  def iterallkeys(self):
+    if not self._dead:
+      return iter(self._keys)
+    return (key for key in self._keys if key is not _absent)
+
+  def iterallvalues(self, key=_absent):
+    if key is not _absent:
+      if key in self._map:
+        return iter(self.getlist(key))
+      raise KeyError(key)
+    if not self._dead:
+      return iter(self._values)
+    return (value for key, value in izip(self._keys, self._values)
+            if key is not _absent)
+
+  def reverse(self):
+    self._compact(force=True)
+    self._keys.reverse()
+    self._values.reverse()
+    last = len(self._keys) - 1
+    for positions in self._map.itervalues():
+      positions[:] = [last - position for position in reversed(positions)]
+    return self
+
+  def __getstate__(self):
+    self._compact(force=True) # _absent can't be pickled.
+    return self.__dict__
+
+  def __setstate__(self, state):
+    if '_items' in state: # Pickled with omdict's linked list storage.
+      self.__init__(list(state['_items'].iteritems()))
+    else:
+      self.__dict__.update(state)
+
+  def _update_updateall(self, replace_at_most_one, *args, **kwargs):
+    """
+    Subclassed from omdict._update_updateall() to drop the leftovers cleared by
+    [] values in one pass at the end, instead of every time a [] value is
+    binned, so update() and updateall() take linear time.
+    """
+    replacements, leftovers, cleared = {}, [], {}
+    for mapping in chain(args, [kwargs]):
+      self._bin_update_items(self._items_iterator(mapping), replace_at_most_one,
+                             replacements, leftovers, cleared)
+
+    # Drop the leftovers binned before their key was last cleared.
+    if cleared:
+      leftovers = [item for i, item in enumerate(leftovers)
+                   if i >= cleared.get(item[0], 0)]
+
+    # First, replace existing values for each key.
+    for key, values in replacements.iteritems():
+      self.setlist(key, values)
+    # Then, add the leftover items to the end of the list of all items.
+    for key, value in leftovers:
+      self.add(key, value)
+
   def _bin_update_items(self, items, replace_at_most_one,
-                        replacements, leftovers):
+                        replacements, leftovers, cleared):
     """
     Subclassed from omdict._bin_update_items() to make update() and updateall()
     process lists of values as multiple values.
     
-    <replacements and <leftovers> are modified directly, ala pass by reference.
+    <replacements>, <leftovers>, and <cleared> are modified directly, ala pass
+    by reference. <cleared> maps each key cleared by a [] value to the number of
+    leftovers binned before it was last cleared.
     """
+    _map = self._map
     for key, values in items:
       # <values> is not a list or an empty list.
-      if (not self._quacks_like_a_list_but_not_str(values) or
-          self._quacks_like_a_list_but_not_str(values) and not values):
+      if (type(values) in _SCALARS or
+          not self._quacks_like_a_list_but_not_str(values) or not values):
         values = [values]
 
       for value in values:
-        # If the value is [], remove any existing leftovers with key <key> and
-        # set the list of values itself to [], which in turn will later delete
-        # <key> when [] is passed to omdict.setlist() in
-        # omdict._update_updateall().
+        # If the value is [], mark any existing leftovers with key <key> to be
+        # dropped and set the list of values itself to [], which in turn will
+        # later delete <key> when [] is passed to setlist() in
+        # _update_updateall().
         if value == []:
           replacements[key] = []
-          leftovers[:] = filter(lambda item: key != item[0], leftovers)
+          cleared[key] = len(leftovers)
           continue
 
         # If there are existing items with key <key> that have yet to be marked
         # for replacement, mark that item's value to be replaced by <value> by
         # appending it to <replacements>.
-        if (key in self and (key not in replacements or 
-            (key in replacements and replacements[key] == []))):
+        if key in _map and (key not in replacements or
+                            replacements[key] == []):
           replacements[key] = [value]
-        elif (key in self and not replace_at_most_one and
-              len(replacements[key]) < len(self.values(key))):
+        elif (key in _map and not replace_at_most_one and
+              len(replacements[key]) < len(_map[key])):
           replacements[key].append(value)
         else:
           if replace_at_most_one:
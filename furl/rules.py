@@ -0,0 +1,263 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+"""
+Query parameter filtering rules, like dropping tracking parameters and session
+IDs, compiled once and applied to many URLs in one pass over each URL's query.
+"""
+
+import re
+import fnmatch
+
+from .furl import (
+  Query, _split_url, _parse_netloc, _split_pairs, _decode_pair, _encode_pair)
+
+# Decision of Rules._decide() for parameters that are dropped.
+_DROP = object()
+_absent = object()
+
+class Rules(object):
+  """
+  Compiled set of query parameter filtering rules. A parameter is kept if its
+  key is allowed for the URL's host and isn't dropped. A kept parameter's value
+  is then rewritten by the first rewrite rule that matches its key.
+
+  Key patterns are either exact keys, fnmatch style globs like 'utm_*', or
+  compiled regular expressions, which match the keys they search() in. Keys are
+  matched decoded, 'a b' not 'a+b'.
+
+  Example:
+    rules = Rules(drop=['utm_*', 'fbclid', re.compile('^sessionid$', re.I)],
+                  allow={'www.pumps.com': ['id', 'page']},
+                  rewrite=[('ref', lambda value: value.lower())])
+
+    rules.filter_url('http://www.yahoo.com/?utm_source=a&b=c') ==
+      'http://www.yahoo.com/?b=c'
+    rules.apply(furl('http://www.pumps.com/?id=1&b=c')).url ==
+      'http://www.pumps.com/?id=1'
+
+  Attributes:
+    MAX_DECISIONS: Number of host and key decisions memoized before the memo
+      is cleared.
+  """
+  MAX_DECISIONS = 4096
+
+  def __init__(self, drop=(), allow=None, rewrite=None):
+    """
+    Params:
+      drop: Iterable of key patterns of the parameters to drop.
+      allow: Dictionary of hosts, or host globs like '*.pumps.com', and the
+        iterables of key patterns of the only parameters kept in URLs with that
+        host. Exact hosts take precedence over globs, and longer globs over
+        shorter globs.
+      rewrite: Dictionary, or list of (key pattern, function) pairs, of the
+        functions that rewrite the values of kept parameters. Each function is
+        called with a parameter's decoded value and returns its new value, or
+        None to drop the parameter.
+
+    Raises: ValueError on invalid key pattern.
+    """
+    self._drop = _compile(drop)
+
+    allow = dict(allow or {})
+    self._allow = dict((host.lower(), _compile(patterns))
+                       for host, patterns in allow.iteritems()
+                       if not _isglob(host))
+    self._allowglobs = sorted(
+      [(host.lower(), _compile(patterns))
+       for host, patterns in allow.iteritems() if _isglob(host)],
+      key=lambda pair: -len(pair[0]))
+    self._hosts = bool(allow)
+
+    if hasattr(rewrite, 'items') and callable(rewrite.items):
+      rewrite = rewrite.items()
+    self._rewrite = [(_compile([pattern]), func)
+                     for pattern, func in (rewrite or [])]
+
+    self._decisions = {}
+
+  def apply(self, f, host=None):
+    """
+    Filter and rewrite the query parameters of <f> in place, in one pass over
+    its parameters.
+
+    Params:
+      f: furl, or Query of a URL with host <host>.
+      host: Host of the URL of Query <f>. Only used by allow rules.
+    Returns: <f>.
+    """
+    if isinstance(f, Query):
+      query = f
+    else:
+      query, host = f.query, f.host
+
+    items, changed = [], False
+    for key, value in query.params.iterallitems():
+      decision = self._decide(host, key)
+      if decision is None:
+        items.append((key, value))
+        continue
+
+      changed = True
+      if decision is not _DROP:
+        value = decision(value)
+        if value is not None:
+          items.append((key, value))
+
+    if changed:
+      query.params = items
+    return f
+
+  def filter_query(self, querystr, host=None, delimeter=None):
+    """
+    Filter and rewrite the parameters of the encoded query string <querystr>
+    without building a Query. Kept parameters that aren't rewritten are kept
+    exactly as they're encoded in <querystr>.
+
+    Params:
+      host: Host of the URL of <querystr>. Only used by allow rules.
+      delimeter: Delimeter separating the key:value pairs of <querystr>, as
+        passed to Query.load(). Defaults to None, which splits pairs on both
+        '&' and ';' and joins them with '&'.
+    Returns: The filtered query string, or <querystr> itself if no parameter
+    was dropped or rewritten.
+    """
+    kept, changed = [], False
+    for pairstr in _split_pairs(querystr, delimeter):
+      if not pairstr:
+        continue
+      key, value = _decode_pair(pairstr)
+      decision = self._decide(host, key)
+      if decision is None:
+        kept.append(pairstr)
+        continue
+
+      changed = True
+      if decision is not _DROP:
+        value = decision(value)
+        if value is not None:
+          kept.append(_encode_pair(key, value, Query.SAFE_KEY_CHARS,
+                                   Query.SAFE_VALUE_CHARS))
+
+    if not changed:
+      return querystr
+    return (delimeter or '&').join(kept)
+
+  def filter_url(self, url):
+    """
+    Filter and rewrite the query parameters of <url> with filter_query(),
+    without parsing the rest of the URL unless there are allow rules, which
+    need the URL's host.
+
+    Returns: The filtered URL string. The '?' is dropped if no parameters are
+    left.
+
+    Raises: ValueError on invalid URL if there are allow rules.
+    """
+    url = str(url)
+    start = url.find('?')
+    if start < 0:
+      return url
+    end = url.find('#')
+    if end < 0:
+      end = len(url)
+    elif end < start: # The '?' is in the fragment.
+      return url
+
+    host = None
+    if self._hosts:
+      host = _parse_netloc(_split_url(url)[1])[2]
+
+    querystr = url[start + 1:end]
+    filtered = self.filter_query(querystr, host)
+    if filtered is querystr:
+      return url
+    return url[:start + 1 if filtered else start] + filtered + url[end:]
+
+  def map(self, urls):
+    """
+    Returns: Iterator of each URL in <urls> filtered with filter_url(), so
+    <urls> can be an arbitrarily long stream of URLs.
+
+    Raises: ValueError on invalid URL if there are allow rules.
+    """
+    filter_url = self.filter_url
+    for url in urls:
+      yield filter_url(url)
+
+  def _decide(self, host, key):
+    """
+    Returns: _DROP if parameters with key <key> are dropped from URLs with host
+    <host>, the function that rewrites their values if they're rewritten, or
+    None if they're kept as is. Decisions are memoized.
+    """
+    if not self._hosts:
+      host = None
+    decisions = self._decisions
+    decision = decisions.get((host, key), _absent)
+    if decision is not _absent:
+      return decision
+
+    name = key if isinstance(key, basestring) else str(key)
+    allowed = self._allowed(host)
+    if self._drop(name) or (allowed is not None and not allowed(name)):
+      decision = _DROP
+    else:
+      decision = next(
+        (func for matches, func in self._rewrite if matches(name)), None)
+
+    if len(decisions) >= self.MAX_DECISIONS:
+      decisions.clear()
+    decisions[(host, key)] = decision
+    return decision
+
+  def _allowed(self, host):
+    """
+    Returns: The key matcher of the allow rule for <host>, or None if no allow
+    rule applies to <host>.
+    """
+    if not host:
+      return None
+    host = host.lower()
+    allowed = self._allow.get(host)
+    if allowed is None:
+      for glob, matches in self._allowglobs:
+        if fnmatch.fnmatchcase(host, glob):
+          return matches
+    return allowed
+
+def _isglob(pattern):
+  return any(c in pattern for c in '*?[')
+
+def _compile(patterns):
+  """
+  Returns: Function that returns True if a key matches any of the key patterns
+  in <patterns>. Exact keys are looked up in a set, and all globs are combined
+  into one regular expression.
+
+  Raises: ValueError on invalid key pattern.
+  """
+  exact, globs, searches = set(), [], []
+  for pattern in patterns:
+    if isinstance(pattern, basestring):
+      if _isglob(pattern):
+        globs.append('(?:%s)' % fnmatch.translate(pattern))
+      else:
+        exact.add(pattern)
+    elif hasattr(pattern, 'search') and callable(pattern.search):
+      searches.append(pattern.search)
+    else:
+      raise ValueError("Invalid key pattern: %r" % (pattern,))
+  if globs:
+    searches.append(re.compile('|'.join(globs)).match)
+
+  exact = frozenset(exact)
+  def matches(key):
+    return key in exact or any(search(key) for search in searches)
+  return matches
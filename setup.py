@@ -32,6 +32,7 @@ setup(name='furl',
                    'Programming Language :: Python :: 2.7',
                    ],
       install_requires=['orderedmultidict >= 0.7'],
+      extras_require={'frame': ['numpy'], 'aio': ['trollius']},
       test_suite='tests',
       tests_require=[],
       )
@@ -0,0 +1,92 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+try:
+  import trollius as asyncio
+  from trollius import From, Return
+  from concurrent.futures import ThreadPoolExecutor
+  import furl.aio
+except ImportError: # trollius isn't installed.
+  asyncio = None
+
+def _secure(f):
+  return f.set(scheme='https').remove(args=['utm_source'])
+
+@unittest.skipIf(asyncio is None, 'furl.aio requires trollius.')
+class TestAio(unittest.TestCase):
+  def setUp(self):
+    self.loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(self.loop)
+    self.urls = ['http://www.pumps.com/%d?utm_source=a&b=%d' % (i, i)
+                 for i in range(250)] + ['', 'a/b?c=c', 'ftp://www.yahoo.com']
+
+  def tearDown(self):
+    self.loop.close()
+    asyncio.set_event_loop(None)
+
+  def _run(self, coroutine):
+    return self.loop.run_until_complete(coroutine)
+
+  def test_aparse(self):
+    expected = [furl.furl(url).url for url in self.urls]
+    for chunksize in [1, 7, 1000]:
+      furls = self._run(furl.aio.aparse(self.urls, chunksize=chunksize))
+      assert all(isinstance(f, furl.furl) for f in furls)
+      assert [f.url for f in furls] == expected
+
+    executor = ThreadPoolExecutor(2)
+    try:
+      furls = self._run(furl.aio.aparse(
+        iter(self.urls), chunksize=10, executor=executor))
+      assert [f.url for f in furls] == expected
+    finally:
+      executor.shutdown()
+
+    assert self._run(furl.aio.aparse([])) == []
+
+  def test_amap(self):
+    expected = [str(_secure(furl.furl(url))) for url in self.urls]
+    assert self._run(furl.aio.amap(_secure, self.urls, chunksize=7)) == expected
+
+    executor = ThreadPoolExecutor(2)
+    try:
+      results = self._run(furl.aio.amap(
+        _secure, self.urls, executor=executor, loop=self.loop))
+      assert results == expected
+    finally:
+      executor.shutdown()
+
+  def test_yields_between_chunks(self):
+    ticks = []
+
+    @asyncio.coroutine
+    def ticker():
+      for i in range(10):
+        ticks.append(i)
+        yield From(asyncio.sleep(0))
+
+    @asyncio.coroutine
+    def both():
+      task = asyncio.Task(ticker(), loop=self.loop)
+      results = yield From(furl.aio.aparse(self.urls, chunksize=50))
+      ticked = len(ticks) # Ticks that ran while parsing.
+      yield From(task)
+      raise Return((results, ticked))
+
+    results, ticked = self._run(both())
+    assert len(results) == len(self.urls) and ticked >= 5
+
+  def test_errors(self):
+    with self.assertRaises(ValueError):
+      self._run(furl.aio.aparse(['http://www.pumps.com:invalid/']))
+    with self.assertRaises(ValueError):
+      self._run(furl.aio.amap(_secure, self.urls, chunksize=0))
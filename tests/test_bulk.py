@@ -0,0 +1,61 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import unittest
+
+import furl
+import furl.bulk
+
+# Transformations are defined at the top level so they can be pickled and sent
+# to worker processes.
+def _secure(f):
+  return f.set(scheme='https').remove(args=['utm_source'])
+
+def _in_place(f):
+  f.path.add('sup')
+
+def _host(f):
+  return f.host
+
+def _newline(f):
+  return f.set(host='a\nb')
+
+class TestBulk(unittest.TestCase):
+  def setUp(self):
+    self.urls = ['http://www.pumps.com/%d?utm_source=a&b=%d' % (i, i)
+                 for i in range(250)] + ['', 'a/b?c=c', 'ftp://www.yahoo.com']
+
+  def test_map(self):
+    expected = [str(_secure(furl.furl(url))) for url in self.urls]
+    for workers in [1, 3]:
+      for chunksize in [1, 7, 1000]:
+        results = furl.bulk.map(_secure, self.urls, workers=workers,
+                                chunksize=chunksize)
+        assert list(results) == expected
+
+    # <func> can modify the furl in place or return a non-furl.
+    results = furl.bulk.map(_in_place, self.urls[-3:], workers=2, chunksize=1)
+    assert list(results) == ['/sup', '/a/b/sup?c=c', 'ftp://www.yahoo.com/sup']
+    results = furl.bulk.map(_host, iter(self.urls[-2:]), workers=2)
+    assert list(results) == ['', 'www.yahoo.com']
+
+    assert list(furl.bulk.map(_secure, [], workers=2)) == []
+
+  def test_errors(self):
+    for workers in [1, 2]:
+      with self.assertRaises(ValueError):
+        list(furl.bulk.map(_secure, ['http://www.pumps.com:invalid/'],
+                           workers=workers))
+      with self.assertRaises(ValueError):
+        list(furl.bulk.map(_secure, ['a\nb'], workers=workers))
+      with self.assertRaises(ValueError):
+        list(furl.bulk.map(_newline, ['http://www.pumps.com/'],
+                           workers=workers))
+    with self.assertRaises(ValueError):
+      list(furl.bulk.map(_secure, self.urls, chunksize=0))
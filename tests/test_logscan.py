@@ -0,0 +1,65 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import furl
+import furl.logscan
+
+LINE = '127.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "%s" 200 2326 "-" "-"\n'
+
+class TestLogscan(unittest.TestCase):
+  def setUp(self):
+    self.tmpdir = tempfile.mkdtemp()
+
+  def tearDown(self):
+    shutil.rmtree(self.tmpdir)
+
+  def _log(self, requests):
+    path = os.path.join(self.tmpdir, 'access.log')
+    with open(path, 'wb') as f:
+      f.write(''.join(LINE % request for request in requests))
+    return path
+
+  def test_scan(self):
+    log = self._log(['GET /a/b?c=c&d=d HTTP/1.1', 'POST /e HTTP/1.0', '-',
+                     'CONNECT http://user@[::1]:8080/f#g HTTP/1.1',
+                     'GET /h%20i?j=k%20l'])
+    views = list(furl.logscan.scan(log))
+    assert [view.url for view in views] == [
+      '/a/b?c=c&d=d', '/e', 'http://user@[::1]:8080/f#g', '/h%20i?j=k%20l']
+    assert all(isinstance(view, furl.URLView) for view in views)
+
+    view = views[2]
+    assert (view.scheme, view.username, view.host, view.port) == (
+      'http', 'user', '[::1]', 8080)
+    assert (view.pathstr, view.fragmentstr) == ('/f', 'g')
+    assert views[0].args.allitems() == [('c', 'c'), ('d', 'd')]
+    assert views[3].path.segments == ['h i']
+    assert views[3].furl().set(host='pumps.com').url == (
+      '//pumps.com/h%20i?j=k+l')
+
+    # File objects and custom regular expressions.
+    with open(log, 'rb') as f:
+      assert [v.url for v in furl.logscan.scan(f, r'" \d+ (\d+)')] == [
+        '2326'] * 5
+
+    # Empty logs.
+    assert list(furl.logscan.scan(self._log([]))) == []
+
+  def test_invalid(self):
+    log = self._log(['GET /a HTTP/1.1', 'GET http://[::1/b HTTP/1.1',
+                     'GET /c HTTP/1.1'])
+    with self.assertRaises(ValueError):
+      list(furl.logscan.scan(log))
+    views = furl.logscan.scan(log, skip_invalid=True)
+    assert [view.url for view in views] == ['/a', '/c']
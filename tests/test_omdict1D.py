@@ -7,6 +7,7 @@
 #
 # License: Build Amazing Things (Unlicense)
 
+import pickle
 import unittest
 from itertools import izip, chain, product, repeat, permutations
 
@@ -94,6 +95,24 @@ class TestOmdict1D(unittest.TestCase):
       omd.updateall(update)
       assert omd.allitems() == result
 
+  def test_update_updateall_leftovers(self):
+    # [] values drop the new items of their key from earlier mappings, too, but
+    # not those after them.
+    omd = omdict1D([(1,None), (2,None)])
+    omd.updateall([(3,3), (1,1), (3,33)], [(1,11), (1,111), (3,[])], [(3,333)],
+                  c=[])
+    assert omd.allitems() == [(1,1), (2,None), (1,11), (1,111), (3,333)]
+    omd = omdict1D([(1,None), (2,None)])
+    omd.update([(3,3), (4,4)], [(3,[])], d=[])
+    assert omd.allitems() == [(1,None), (2,None), (4,4)]
+
+    # Many keys.
+    omd = omdict1D([(i % 100, i) for i in range(1000)])
+    omd.updateall([(i, []) for i in range(0, 100, 2)] +
+                  [(i, i) for i in range(1, 200, 2)])
+    assert omd.keys() == range(1, 200, 2)
+    assert omd.allitems() == [(i, i) for i in range(1, 200, 2)]
+
   def test_add(self):
     runningsum = []
     omd = omdict1D()
@@ -141,6 +160,14 @@ class TestOmdict1D(unittest.TestCase):
     omd.set(_unique, [])
     assert _unique not in omd
 
+    # Existing items keep their positions.
+    omd = omdict1D([(1,1), (2,2), (1,11), (1,111)])
+    assert omd.setlist(1, [0]).allitems() == [(1,0), (2,2)]
+    assert omd.setlist(1, [5,6,7]).allitems() == [(1,5), (2,2), (1,6), (1,7)]
+    assert omd.setlist(1, iter([8])).allitems() == [(1,8), (2,2)]
+    assert omd.setlist(1, []).allitems() == [(2,2)]
+    assert omd.setlist(3, []).allitems() == [(2,2)]
+
   def test_setitem(self):
     omd = omdict1D()
     for value, valuelist in izip(self.values, self.valuelists):
@@ -167,3 +194,46 @@ class TestOmdict1D(unittest.TestCase):
     assert omd.getlist(_unique) == [1,2,3]
     omd[_unique] = []
     assert _unique not in omd
+
+  def test_additems(self):
+    omd = omdict1D([(1,1)])
+    assert omd.additems([(2,2), (1,[11,111]), (3,[])]) == omd
+    assert omd.allitems() == [(1,1), (2,2), (1,11), (1,111)]
+    omd.additems(iter([(4,None), (1,'a')]))
+    assert omd.allitems() == [(1,1), (2,2), (1,11), (1,111), (4,None), (1,'a')]
+
+  def test_removal(self):
+    # Removed items and keys are compacted away once they outnumber the
+    # remaining ones, and iteration, order, and positions stay consistent.
+    omd = omdict1D([(i % 40, i) for i in range(400)])
+    for key in range(0, 40, 2):
+      assert omd.poplist(key) == range(key, 400, 40)
+    assert omd.keys() == range(1, 40, 2) and omd.size() == 200
+    for key in range(1, 39, 2):
+      omd.setlist(key, [key])
+    assert omd.allitems() == (
+      [(i, i) for i in range(1, 39, 2)] + [(39, i) for i in range(39, 400, 40)])
+    assert omd.popvalue(39, 79) == 79 and omd.popvalue(39, last=False) == 39
+    assert omd.popitem(fromall=True, last=False) == (1, 1)
+    assert omd.popitem() == (39, 119) and 39 not in omd
+    assert len(omd._keys) < 400 and len(omd._order) < 40
+
+    omd.add(1, 'a').add(3, 'b')
+    assert omd.keys()[-2:] == [37, 1] and omd.getlist(3) == [3, 'b']
+    assert omd.reverse().allitems()[:3] == [(3,'b'), (1,'a'), (37,37)]
+    assert omd.keys()[-2:] == [37, 1]
+
+  def test_pickle(self):
+    omd = omdict1D([(1,1), (2,2), (1,11), (3,3)])
+    omd.popvalue(1, last=False)
+    del omd[2]
+    for protocol in [0, 2]:
+      unpickled = pickle.loads(pickle.dumps(omd, protocol))
+      assert unpickled.allitems() == [(1,11), (3,3)]
+      assert unpickled.keys() == [1, 3]
+      assert unpickled.add(2, 2).allitems() == [(1,11), (3,3), (2,2)]
+
+    # omdict1Ds pickled with omdict's linked list storage.
+    old = omdict1D.__new__(omdict1D)
+    old.__setstate__(omdict([(1,1), (2,2), (1,11)]).__dict__)
+    assert old.allitems() == [(1,1), (2,2), (1,11)]
@@ -0,0 +1,106 @@
+#
+# furl: URL manipulation made simple.
+#
+# Arthur Grunseid
+# grunseid.com
+# grunseid@gmail.com
+#
+# License: Build Amazing Things (Unlicense)
+
+import re
+import unittest
+
+import furl
+from furl.rules import Rules
+
+class TestRules(unittest.TestCase):
+  def setUp(self):
+    self.rules = Rules(
+      drop=['utm_*', 'fbclid', re.compile('^(php)?sessid$', re.I)],
+      allow={'www.pumps.com': ['id', 'p?ge'], '*.yahoo.com': ['q'],
+             '*.news.yahoo.com': ['q', 'id']},
+      rewrite=[('ref', lambda value: value.lower()),
+               ('tag*', lambda value: value or None)])
+
+  def test_filter_query(self):
+    rules = self.rules
+    assert rules.filter_query('utm_source=a&b=c;utm_medium=d') == 'b=c'
+    assert rules.filter_query('PHPSESSID=1&fbclid=2&sessid=3') == ''
+    assert rules.filter_query('utm%5Fsource=a&b+c=d') == 'b+c=d'
+    assert rules.filter_query('ref=ABC&tag=&tags=A%20B') == 'ref=abc&tags=A+B'
+
+    # Untouched queries and pairs are kept exactly as they're encoded.
+    querystr = 'b=c;d=e%2f&f'
+    assert rules.filter_query(querystr) is querystr
+    assert rules.filter_query('b=c%2f;d&fbclid=1') == 'b=c%2f&d'
+    assert rules.filter_query('b=c;fbclid=1;d', delimeter=';') == 'b=c;d'
+
+    # Allowlists.
+    assert rules.filter_query('id=1&page=2&b=3', 'www.pumps.com') == (
+      'id=1&page=2')
+    assert rules.filter_query('id=1&q=2&utm_a=3', 'a.yahoo.com') == 'q=2'
+    assert rules.filter_query('id=1&q=2', 'a.news.yahoo.com') == 'id=1&q=2'
+    assert rules.filter_query('id=1&b=2&utm_a=3', 'pumps.com') == 'id=1&b=2'
+
+  def test_filter_url(self):
+    rules = self.rules
+    for url, expected in [
+        ('', ''),
+        ('http://a.com/', 'http://a.com/'),
+        ('http://a.com/?b=c', 'http://a.com/?b=c'),
+        ('http://a.com/?utm_source=a&b=c#d', 'http://a.com/?b=c#d'),
+        ('http://a.com/?utm_source=a#d', 'http://a.com/#d'),
+        ('http://a.com/#?fbclid=1', 'http://a.com/#?fbclid=1'),
+        ('/a?fbclid=1&b', '/a?b'),
+        ('http://WWW.PUMPS.COM:80/?id=1&b=2', 'http://WWW.PUMPS.COM:80/?id=1'),
+        ]:
+      assert rules.filter_url(url) == expected
+      assert rules.filter_url(furl.furl(url)) == str(furl.furl(expected))
+
+    urls = ['http://www.pumps.com/%d?utm_source=a&b=%d&id=%d' % (i, i, i)
+            for i in range(100)]
+    assert list(rules.map(iter(urls))) == [
+      'http://www.pumps.com/%d?id=%d' % (i, i) for i in range(100)]
+
+    with self.assertRaises(ValueError):
+      rules.filter_url('http://a.com:port/?b=c')
+    assert Rules(drop=['b']).filter_url('http://a.com:port/?b=c') == (
+      'http://a.com:port/')
+
+  def test_apply(self):
+    rules = self.rules
+    f = furl.furl('http://a.com/?utm_source=a&b=c&ref=ABC&tag=&b=d')
+    assert rules.apply(f) is f
+    assert f.url == 'http://a.com/?b=c&ref=abc&b=d'
+    assert rules.apply(f).url == 'http://a.com/?b=c&ref=abc&b=d'
+
+    f = furl.furl('http://www.pumps.com/?id=1&page=2&b=3')
+    assert rules.apply(f).args.allitems() == [('id','1'), ('page','2')]
+
+    query = furl.Query('id=1&b=2&utm_a=3')
+    assert rules.apply(query).params.allitems() == [('id','1'), ('b','2')]
+    rules.apply(query, 'www.pumps.com')
+    assert str(query) == 'id=1'
+
+    # The same parameters are kept by apply() and filter_url().
+    urls = ['http://www.pumps.com/?id=1&utm_b=2&c=3',
+            'http://a.news.yahoo.com/?q=a+b&id=%2F&x=1',
+            'http://b.com/?ref=A;c=%C3%A9&fbclid=1&PhpSessId=2']
+    for url in urls:
+      assert str(rules.apply(furl.furl(url))) == str(
+        furl.furl(rules.filter_url(url)))
+
+  def test_decisions(self):
+    rules = Rules(drop=['a*'])
+    rules.MAX_DECISIONS = 10
+    for i in range(25):
+      assert rules.filter_query('a%d=1&b%d=2' % (i, i)) == 'b%d=2' % i
+      assert len(rules._decisions) <= 10
+
+    # Non-string keys are matched as strings.
+    query = furl.Query()
+    query.params.update([(1, 1), ('a1', 2), (2, 3)])
+    assert Rules(drop=['1', '?1']).apply(query).params.allitems() == [(2, 3)]
+
+    with self.assertRaises(ValueError):
+      Rules(drop=[1])